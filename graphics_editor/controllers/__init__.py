@@ -11,14 +11,42 @@ Controladores disponíveis:
 - DrawingController: Gerencia o processo de desenho de objetos 2D.
 - SceneController: Gerencia os objetos na cena gráfica (2D e 3D), incluindo recorte e projeção.
 - TransformationController: Gerencia a aplicação de transformações geométricas.
+
+Os controladores são importados sob demanda (PEP 562): importar o pacote não
+carrega os módulos Qt dos controladores até que um deles seja acessado.
 """
 
-from .drawing_controller import DrawingController
-from .scene_controller import SceneController
-from .transformation_controller import TransformationController
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .drawing_controller import DrawingController
+    from .scene_controller import SceneController
+    from .transformation_controller import TransformationController
+
+# Nome exportado -> submódulo que o define
+_LAZY_IMPORTS = {
+    "DrawingController": ".drawing_controller",
+    "SceneController": ".scene_controller",
+    "TransformationController": ".transformation_controller",
+}
 
 __all__ = [
     "DrawingController",
     "SceneController",
     "TransformationController",
 ]
+
+
+def __getattr__(name: str):
+    """Importa o controlador solicitado na primeira vez em que é acessado."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Próximos acessos não passam por __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
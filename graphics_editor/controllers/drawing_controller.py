@@ -1,10 +1,12 @@
 # graphics_editor/controllers/drawing_controller.py
-from PyQt5.QtCore import QObject, pyqtSignal, QPointF, QLineF, Qt
-from PyQt5.QtGui import QPainterPath, QPen, QColor, QPolygonF
+from PyQt5.QtCore import QObject, pyqtSignal, QPointF, QLineF, Qt, QTimer
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor
 from PyQt5.QtWidgets import (
-    QGraphicsScene, QGraphicsLineItem, QGraphicsPathItem, QMessageBox,
+    QGraphicsScene, QGraphicsItem, QGraphicsItemGroup, QGraphicsLineItem, QGraphicsPathItem,
 )
-from typing import List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
 
 from ..state_manager import EditorStateManager, DrawingMode
 from ..models.point import Point
@@ -12,10 +14,127 @@ from ..models.line import Line
 from ..models.polygon import Polygon
 from ..models.bezier_curve import BezierCurve
 from ..models.bspline_curve import BSplineCurve # Adicionado
+from ..utils.qpath import array_to_qpath
+from ..utils.simplify import simplify_mask
 
 # Define DataObject para incluir BSplineCurve
 DataObject2D = Union[Point, Line, Polygon, BezierCurve, BSplineCurve]
 
+# Modos de desenho como constantes do módulo (evita o acesso ao atributo da classe a cada uso)
+_POINT = DrawingMode.POINT
+_LINE = DrawingMode.LINE
+_POLY = DrawingMode.POLYGON
+_BEZIER = DrawingMode.BEZIER
+_BSPLINE = DrawingMode.BSPLINE
+# Modos finalizados pelo clique direito
+_RIGHT_CLICK_FINISH_MODES = frozenset((_POLY, _BEZIER, _BSPLINE))
+
+
+def _bezier_state(num_pts: int) -> Tuple[int, int, bool]:
+    """
+    Estado de uma Bézier composta com 'num_pts' pontos de controle.
+
+    Um segmento precisa de 4 pontos e segmentos C0 compartilham o último/primeiro
+    ponto, então uma curva com k segmentos tem 3k+1 pontos.
+
+    Returns:
+        Tuple[int, int, bool]: (segmentos completos, pontos já colocados no
+                               segmento atual, se a curva pode ser finalizada)
+    """
+    if num_pts < 1:
+        return 0, 0, False
+    segments, rem = divmod(num_pts - 1, 3)
+    return segments, rem, segments >= 1 and rem == 0
+
+
+def _compute_bezier_status(num_pts: int) -> str:
+    """Monta a mensagem de status do desenho de Bézier para 'num_pts' pontos de controle."""
+    status = f"Bézier: {num_pts} ponto(s) de controle."
+    # Lógica para indicar quantos pontos faltam para completar um segmento
+    segments, rem, can_finish = _bezier_state(num_pts)
+    if num_pts < 4:
+        status += f" Adicione mais {4 - num_pts} para o 1º segmento."
+    elif can_finish: # Completa um ou mais segmentos
+        status += f" {segments} segmento(s) completo(s). Adicione +3 para próximo, ou finalize."
+    else: # Em meio a um segmento
+        status += f" Adicione mais {3 - rem} para completar segmento atual."
+    status += " Botão direito para finalizar."
+    return status
+
+
+def _compute_bspline_status(num_pts: int) -> str:
+    """Monta a mensagem de status do desenho de B-spline para 'num_pts' pontos de controle."""
+    degree = BSplineCurve.DEFAULT_DEGREE
+    min_pts_for_default_degree = degree + 1
+    if num_pts == 0:
+        status = f"B-spline: Clique para adicionar pontos de controle (mín {min_pts_for_default_degree} para grau {degree})."
+    elif num_pts < min_pts_for_default_degree:
+        status = f"B-spline: {num_pts} ponto(s). Adicione mais {min_pts_for_default_degree - num_pts} para grau {degree}."
+    else:
+        status = f"B-spline: {num_pts} ponto(s) de controle."
+    status += " Botão direito para finalizar."
+    return status
+
+
+# Mensagens pré-computadas para as quantidades usuais de pontos de controle
+_BEZIER_STATUS: List[str] = [_compute_bezier_status(n) for n in range(256)]
+_BSPLINE_STATUS: List[str] = [_compute_bspline_status(n) for n in range(256)]
+
+# QPainterPath.reserve só existe a partir do Qt 5.13
+_PATH_HAS_RESERVE = hasattr(QPainterPath, "reserve")
+
+
+class _PreviewPathItem(QGraphicsPathItem):
+    """
+    Item de caminho do preview desenhado sem antialiasing.
+
+    O polígono de controle e o elástico são polilinhas tracejadas de 1 px e
+    transitórias: o traçado serrilhado é bem mais barato e a diferença visual
+    é mínima. O estado do QPainter é salvo pela cena antes de cada item, então
+    os objetos definitivos continuam com antialiasing.
+    """
+
+    def paint(self, painter: QPainter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        super().paint(painter, option, widget)
+
+
+@dataclass(slots=True)
+class DrawingBuffers:
+    """
+    Estado de um desenho 2D em andamento.
+
+    Agrupado numa única estrutura para que o reset ao finalizar/cancelar
+    seja uma só atribuição (`self._buf = DrawingBuffers()`).
+    """
+
+    # Linha
+    line_start: Optional[Point] = None
+    line_start_qpoint: Optional[QPointF] = None # QPointF de line_start, convertido uma vez
+    # Polígono
+    polygon_points: List[Point] = field(default_factory=list)
+    polygon_is_open: bool = False
+    polygon_is_filled: bool = False
+    pending_first_polygon_point: Optional[Point] = None # Para consulta de propriedades
+    # Bézier e B-spline
+    bezier_points: List[Point] = field(default_factory=list)
+    bspline_points: List[Point] = field(default_factory=list)
+    # QPointF dos pontos já clicados (paralelas às listas acima), para que os
+    # previews só convertam a posição atual do mouse a cada movimento
+    polygon_qpoints: List[QPointF] = field(default_factory=list)
+    bezier_qpoints: List[QPointF] = field(default_factory=list)
+    # Caminhos com os segmentos já confirmados; crescem a cada clique e, no
+    # movimento do mouse, só recebem (numa cópia) o segmento até o cursor
+    committed_polygon_path: QPainterPath = field(default_factory=QPainterPath)
+    committed_bezier_path: QPainterPath = field(default_factory=QPainterPath)
+    # Curva de Bézier dos segmentos completos (cubicTo nativo do Qt, um por segmento)
+    committed_bezier_curve_path: QPainterPath = field(default_factory=QPainterPath)
+    # Coordenadas dos pontos de controle da B-spline num buffer (capacidade, 2)
+    # float64 que dobra ao encher; as 'bspline_n' primeiras linhas são os pontos
+    # clicados e sempre há uma linha livre, onde o preview escreve o cursor
+    bspline_xy: np.ndarray = field(default_factory=lambda: np.empty((8, 2)))
+    bspline_n: int = 0
+
 
 class DrawingController(QObject):
     """
@@ -27,6 +146,25 @@ class DrawingController(QObject):
     object_ready_to_add = pyqtSignal(object) # Emite DataObject2D
     status_message_requested = pyqtSignal(str, int) # (mensagem, timeout_ms)
     polygon_properties_query_requested = pyqtSignal() # Para GraphicsEditor mostrar diálogo
+    warning_requested = pyqtSignal(str, str) # (título, texto); exibido sem bloquear pelo GraphicsEditor
+
+    # Atributos lidos a cada evento do mouse ficam em slots (acesso por
+    # descritor em vez do __dict__; o wrapper do sip ainda mantém um __dict__)
+    __slots__ = (
+        "_scene", "_state_manager", "_mode", "_color", "_buf", "_active_preview",
+        "_temp_item_color", "_temp_item_pen", "_temp_item_brush", "_preview_group", "_temp_line_item",
+        "_temp_path_item", "_temp_rubber_band_item", "_temp_bezier_curve_item",
+        "_bspline_basis_cache", "_bspline_min_pts",
+        "_pending_mouse_pos", "_last_preview_pos", "_preview_timer",
+        "_left_click_dispatch", "_move_dispatch", "_finish_dispatch",
+    )
+
+    PREVIEW_Z_VALUE = 1000 # Previews ficam por cima dos objetos da cena
+    PREVIEW_INTERVAL_MS = 16 # No máximo uma atualização de preview por quadro (~60 Hz)
+    PREVIEW_MIN_DELTA = 0.5 # Movimentos menores que isso (em x e y) não atualizam o preview
+    BSPLINE_BASIS_CACHE_SIZE = 64 # Máximo de matrizes de pesos da B-spline guardadas
+    POLYGON_SIMPLIFY_THRESHOLD = 256 # Polígonos com mais vértices são simplificados ao finalizar
+    POLYGON_SIMPLIFY_TOLERANCE = 0.5 # Distância máxima de um vértice removido (unidades da cena)
 
     def __init__(
         self,
@@ -38,164 +176,314 @@ class DrawingController(QObject):
         self._scene = scene
         self._state_manager = state_manager
 
-        # Estado para desenho de linha
-        self._current_line_start: Optional[Point] = None
-        # Estado para desenho de polígono
-        self._current_polygon_points: List[Point] = []
-        self._current_polygon_is_open: bool = False
-        self._current_polygon_is_filled: bool = False
-        self._pending_first_polygon_point: Optional[Point] = None # Para consulta de propriedades
-        # Estado para desenho de Bézier
-        self._current_bezier_points: List[Point] = []
-        # Estado para desenho de B-spline
-        self._current_bspline_points: List[Point] = []
-
+        # Estado do desenho em andamento (pontos, flags e caminhos confirmados)
+        self._buf = DrawingBuffers()
+        # Modo do desenho com preview em andamento (definido no primeiro ponto
+        # confirmado); None enquanto o usuário só move o mouse sobre a cena
+        self._active_preview: Optional[DrawingMode] = None
 
         # Itens temporários para visualização prévia
         self._temp_item_color = QColor(128, 128, 128, 150) # Cinza translúcido para preview
-        self._temp_item_pen = QPen(self._temp_item_color, 2, Qt.DashLine) # Linha tracejada
-        self._temp_line_item: Optional[QGraphicsLineItem] = None
-        self._temp_polygon_path_item: Optional[QGraphicsPathItem] = None # Renomeado para clareza
-        self._temp_bezier_path_item: Optional[QGraphicsPathItem] = None # Renomeado
-        self._temp_bspline_path_item: Optional[QGraphicsPathItem] = None # Novo
-
-        self._state_manager.drawing_mode_changed.connect(self.cancel_current_drawing)
+        # Caneta única (compartilhada por todos os itens de preview): linha
+        # tracejada cosmética de 1 px, que não é reescalada pelo zoom da vista
+        self._temp_item_pen = QPen(self._temp_item_color, 1, Qt.DashLine)
+        self._temp_item_pen.setCosmetic(True)
+        self._temp_item_pen.setCapStyle(Qt.FlatCap)
+        self._temp_item_pen.setJoinStyle(Qt.BevelJoin)
+        # Previews nunca são preenchidos; o pincel vazio é definido explicitamente
+        self._temp_item_brush = QBrush(Qt.NoBrush)
+        # Os itens de preview são criados uma única vez como filhos de um grupo
+        # persistente na cena; entre desenhos ficam com caminho vazio e o grupo
+        # inteiro é ocultado com um único setVisible
+        self._preview_group = QGraphicsItemGroup()
+        self._preview_group.setZValue(self.PREVIEW_Z_VALUE)
+        self._preview_group.setVisible(False)
+        self._temp_line_item = QGraphicsLineItem()
+        # Só um modo desenha por vez: polígono, Bézier e B-spline compartilham
+        # o mesmo item para o caminho confirmado / curva
+        self._temp_path_item = _PreviewPathItem()
+        # Segmentos que dependem do cursor (polígono e Bézier) ficam num item
+        # pequeno e separado: o movimento do mouse só altera (e suja) a área
+        # desse item, sem recriar nem redesenhar o caminho já confirmado
+        self._temp_rubber_band_item = _PreviewPathItem()
+        # Curva dos segmentos de Bézier já completos, desenhada com linha contínua
+        # por cima do polígono de controle tracejado
+        self._temp_bezier_curve_item = QGraphicsPathItem()
+        for item in self._temp_items():
+            item.setPen(self._temp_item_pen)
+            if isinstance(item, QGraphicsPathItem):
+                item.setBrush(self._temp_item_brush)
+            # O Qt passa a área exposta em option.exposedRect ao pintar
+            item.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+            item.setParentItem(self._preview_group)
+        curve_pen = QPen(self._temp_item_pen)
+        curve_pen.setStyle(Qt.SolidLine)
+        self._temp_bezier_curve_item.setPen(curve_pen)
+        # Só muda quando um segmento é completado: o pixmap em cache é reaproveitado
+        self._temp_bezier_curve_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # Adicionado à cena só depois de montado: uma única inserção no índice
+        # da cena, já com os filhos configurados
+        self._scene.addItem(self._preview_group)
+
+        # Movimentos do mouse são agrupados: guarda-se só a última posição e o
+        # preview é atualizado no máximo uma vez por intervalo do timer
+        self._pending_mouse_pos: Optional[QPointF] = None
+        self._last_preview_pos: Optional[QPointF] = None # Última posição aceita para preview
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_INTERVAL_MS)
+        self._preview_timer.timeout.connect(self._flush_preview)
+
+        # Pesos da base da B-spline de preview por (nº de pontos, grau, amostras)
+        self._bspline_basis_cache: Dict[Tuple[int, int, int], np.ndarray] = {}
+        # Mínimo de pontos para a curva de grau padrão (abaixo disso o preview é a polilinha)
+        self._bspline_min_pts = BSplineCurve.DEFAULT_DEGREE + 1
+
+        # Modo e cor atuais, mantidos em cache e atualizados pelos sinais do
+        # gerenciador de estado (lidos a cada evento do mouse)
+        self._mode: DrawingMode = state_manager.drawing_mode()
+        self._color: QColor = state_manager.draw_color()
+        self._update_path_cache_mode()
+
+        # Tabelas de despacho por modo, montadas uma única vez
+        self._left_click_dispatch: Dict[DrawingMode, Callable[[QPointF], None]] = {
+            _POINT: self._handle_point_click,
+            _LINE: self._handle_line_click,
+            _POLY: self._handle_polygon_click,
+            _BEZIER: self._handle_bezier_click,
+            _BSPLINE: self._handle_bspline_click,
+        }
+        self._move_dispatch: Dict[DrawingMode, Callable[[QPointF], None]] = {
+            _LINE: self._update_line_preview,
+            _POLY: self._update_polygon_preview,
+            _BEZIER: self._update_bezier_preview,
+            _BSPLINE: self._update_bspline_preview,
+        }
+        self._finish_dispatch: Dict[DrawingMode, Callable[[bool, QColor], Optional[bool]]] = {
+            _LINE: self._finish_line,
+            _POLY: self._finish_polygon,
+            _BEZIER: self._finish_bezier,
+            _BSPLINE: self._finish_bspline,
+        }
+
+        self._state_manager.drawing_mode_changed.connect(self._on_drawing_mode_changed)
+        self._state_manager.draw_color_changed.connect(self._on_draw_color_changed)
+
+    def _on_drawing_mode_changed(self, mode: DrawingMode):
+        """Atualiza o modo em cache e cancela o desenho em andamento."""
+        self._mode = mode
+        self._update_path_cache_mode()
+        # Sem desenho em andamento não há buffers a descartar nem preview a ocultar
+        if self._active_preview is None and self._buf.pending_first_polygon_point is None:
+            return
+        self.cancel_current_drawing()
+
+    def _update_path_cache_mode(self):
+        """
+        Define o cache do item de caminho do preview conforme o modo atual.
+
+        Em polígono e Bézier o item só guarda o caminho confirmado, que muda
+        apenas a cada clique: com DeviceCoordinateCache o Qt reaproveita o
+        pixmap ao repintar a vista e só o recria quando setPath é chamado.
+        Na B-spline a curva inteira muda a cada movimento do mouse, e o cache
+        seria invalidado em todo quadro, então fica desligado (assim como nos
+        itens de linha e do elástico, que acompanham o cursor).
+        """
+        cache_mode = (
+            QGraphicsItem.DeviceCoordinateCache
+            if self._mode in (_POLY, _BEZIER)
+            else QGraphicsItem.NoCache
+        )
+        self._temp_path_item.setCacheMode(cache_mode)
+
+    def _on_draw_color_changed(self, color: QColor):
+        """Atualiza a cor de desenho em cache."""
+        self._color = color
 
 
     def set_pending_polygon_properties(
         self, is_open: bool, is_filled: bool, cancelled: bool = False
     ):
         """Define propriedades do polígono pendente após consulta ao usuário."""
-        if cancelled or self._pending_first_polygon_point is None:
+        if cancelled or self._buf.pending_first_polygon_point is None:
             self.status_message_requested.emit("Desenho de polígono cancelado.", 2000)
             self._finish_current_drawing(commit=False) # Reseta estado do polígono
             return
 
-        self._current_polygon_is_open = is_open
-        self._current_polygon_is_filled = is_filled
+        self._buf.polygon_is_open = is_open
+        self._buf.polygon_is_filled = is_filled
         
-        first_point_data = self._pending_first_polygon_point
-        self._pending_first_polygon_point = None # Limpa após uso
+        first_point_data = self._buf.pending_first_polygon_point
+        self._buf.pending_first_polygon_point = None # Limpa após uso
 
-        self._current_polygon_points.append(first_point_data)
-        self._update_polygon_preview(first_point_data.to_qpointf()) # Mostra preview com o 1º ponto
+        first_qpoint = first_point_data.to_qpointf()
+        self._buf.polygon_points.append(first_point_data)
+        self._buf.polygon_qpoints.append(first_qpoint)
+        self._extend_committed_path(self._buf.committed_polygon_path, first_qpoint)
+        self._active_preview = _POLY
+        self._update_polygon_preview(first_qpoint) # Mostra preview com o 1º ponto
 
-        pt_type = "vértices da polilinha" if self._current_polygon_is_open else "vértices do polígono"
+        pt_type = "vértices da polilinha" if self._buf.polygon_is_open else "vértices do polígono"
         self.status_message_requested.emit(f"Polígono: Clique nos {pt_type}. Botão direito para finalizar.", 0)
 
     def handle_scene_left_click(self, scene_pos: QPointF):
         """Manipula clique esquerdo na cena para desenho 2D."""
-        mode = self._state_manager.drawing_mode()
-        color = self._state_manager.draw_color()
-        current_point_model = Point(scene_pos.x(), scene_pos.y(), color=color)
-
-        if mode == DrawingMode.POINT:
-            self.object_ready_to_add.emit(current_point_model)
-        elif mode == DrawingMode.LINE:
-            self._handle_line_click(current_point_model, color)
-        elif mode == DrawingMode.POLYGON:
-            self._handle_polygon_click(current_point_model)
-        elif mode == DrawingMode.BEZIER:
-            self._handle_bezier_click(current_point_model)
-        elif mode == DrawingMode.BSPLINE:
-            self._handle_bspline_click(current_point_model)
-
-
-    def _handle_line_click(self, point_model: Point, color: QColor):
-        if self._current_line_start is None: # Primeiro clique para a linha
-            self._current_line_start = point_model
-            self._update_line_preview(point_model.to_qpointf()) # Inicia preview
+        self._cancel_pending_preview() # O clique atualiza o preview com a posição mais recente
+        handler = self._left_click_dispatch.get(self._mode)
+        if handler is not None:
+            # Cópia própria: o QPointF fica guardado nos buffers do desenho
+            handler(QPointF(scene_pos))
+
+    def _make_point(self, qpoint: QPointF) -> Point:
+        """Cria o modelo Point de um clique aceito, na cor de desenho atual."""
+        return Point(qpoint.x(), qpoint.y(), color=self._color)
+
+    # Os tratadores recebem a posição do clique e só criam o Point depois de
+    # aceitá-lo (cliques duplicados ou em espera do diálogo não alocam modelo)
+    def _handle_point_click(self, qpoint: QPointF):
+        self.object_ready_to_add.emit(self._make_point(qpoint))
+
+    def _handle_line_click(self, qpoint: QPointF):
+        if self._buf.line_start is None: # Primeiro clique para a linha
+            self._buf.line_start = self._make_point(qpoint)
+            self._buf.line_start_qpoint = qpoint
+            self._active_preview = _LINE
+            self._update_line_preview(qpoint) # Inicia preview
             self.status_message_requested.emit("Linha: Clique no ponto final.", 0)
         else: # Segundo clique, finaliza a linha
-            if point_model.get_coords() == self._current_line_start.get_coords():
+            start = self._buf.line_start_qpoint
+            if qpoint.x() == start.x() and qpoint.y() == start.y():
                 self.status_message_requested.emit("Ponto final igual ao inicial. Clique em outro lugar.", 2000)
                 return
-            line_data = Line(self._current_line_start, point_model, color=color)
+            line_data = Line(self._buf.line_start, self._make_point(qpoint), color=self._color)
             self.object_ready_to_add.emit(line_data)
             self._finish_current_drawing(commit=True)
 
-    def _handle_polygon_click(self, point_model: Point):
-        if not self._current_polygon_points and self._pending_first_polygon_point is None:
+    def _handle_polygon_click(self, qpoint: QPointF):
+        if not self._buf.polygon_points and self._buf.pending_first_polygon_point is None:
             # Primeiro clique para o polígono, consulta propriedades
-            self._pending_first_polygon_point = point_model
+            self._buf.pending_first_polygon_point = self._make_point(qpoint)
             self.polygon_properties_query_requested.emit()
             return # Aguarda propriedades
 
         # Se propriedades já foram definidas (ou é o segundo+ ponto)
-        if self._current_polygon_points and point_model.get_coords() == self._current_polygon_points[-1].get_coords():
-            self.status_message_requested.emit("Ponto duplicado ignorado.", 1500)
-            return
+        if self._buf.polygon_qpoints:
+            last = self._buf.polygon_qpoints[-1]
+            if qpoint.x() == last.x() and qpoint.y() == last.y():
+                self.status_message_requested.emit("Ponto duplicado ignorado.", 1500)
+                return
 
-        if self._pending_first_polygon_point is not None: # Usuário clicou antes de diálogo de props fechar
+        if self._buf.pending_first_polygon_point is not None: # Usuário clicou antes de diálogo de props fechar
             self.status_message_requested.emit("Aguardando definição de tipo de polígono.", 2000)
             return
 
-        self._current_polygon_points.append(point_model)
-        self._update_polygon_preview(point_model.to_qpointf())
-        num_pts = len(self._current_polygon_points)
-        pt_type = "vértices da polilinha" if self._current_polygon_is_open else "vértices do polígono"
+        self._buf.polygon_points.append(self._make_point(qpoint))
+        self._buf.polygon_qpoints.append(qpoint)
+        self._extend_committed_path(self._buf.committed_polygon_path, qpoint)
+        self._update_polygon_preview(qpoint)
+        num_pts = len(self._buf.polygon_points)
+        pt_type = "vértices da polilinha" if self._buf.polygon_is_open else "vértices do polígono"
         self.status_message_requested.emit(f"Polígono: {num_pts} {pt_type} adicionado(s). Botão direito para finalizar.",0)
 
 
-    def _handle_bezier_click(self, point_model: Point):
-        self._current_bezier_points.append(point_model)
-        self._update_bezier_preview(point_model.to_qpointf())
+    def _handle_bezier_click(self, qpoint: QPointF):
+        self._buf.bezier_points.append(self._make_point(qpoint))
+        self._buf.bezier_qpoints.append(qpoint)
+        self._extend_committed_path(self._buf.committed_bezier_path, qpoint)
+        qpoints = self._buf.bezier_qpoints
+        if _bezier_state(len(qpoints))[2]: # Este clique completou um segmento
+            curve_path = self._buf.committed_bezier_curve_path
+            if curve_path.elementCount() == 0:
+                curve_path.moveTo(qpoints[0])
+            curve_path.cubicTo(qpoints[-3], qpoints[-2], qpoints[-1])
+        self._active_preview = _BEZIER
+        self._update_bezier_preview(qpoint)
         self._update_bezier_status_message()
 
-    def _handle_bspline_click(self, point_model: Point):
-        self._current_bspline_points.append(point_model)
-        self._update_bspline_preview(point_model.to_qpointf()) # Passa o último ponto clicado
+    def _handle_bspline_click(self, qpoint: QPointF):
+        self._buf.bspline_points.append(self._make_point(qpoint))
+        self._append_bspline_xy(qpoint.x(), qpoint.y())
+        self._active_preview = _BSPLINE
+        self._update_bspline_preview(qpoint) # Passa o último ponto clicado
         self._update_bspline_status_message()
 
 
+    def _append_bspline_xy(self, x: float, y: float):
+        """Acrescenta um ponto de controle ao buffer da B-spline, dobrando-o se necessário."""
+        buf = self._buf
+        n = buf.bspline_n
+        if n + 1 >= len(buf.bspline_xy): # Mantém uma linha livre para o cursor
+            grown = np.empty((2 * len(buf.bspline_xy), 2))
+            grown[:n] = buf.bspline_xy[:n]
+            buf.bspline_xy = grown
+        buf.bspline_xy[n] = (x, y)
+        buf.bspline_n = n + 1
+
+    @staticmethod
+    def _extend_committed_path(path: QPainterPath, qpoint: QPointF):
+        """Acrescenta um ponto confirmado ao caminho (moveTo no primeiro, lineTo nos demais)."""
+        if path.elementCount() == 0:
+            path.moveTo(qpoint)
+        else:
+            path.lineTo(qpoint)
+
     def _update_bezier_status_message(self):
-        num_pts = len(self._current_bezier_points)
-        status = f"Bézier: {num_pts} ponto(s) de controle."
-        # Lógica para indicar quantos pontos faltam para completar um segmento
-        # Um segmento precisa de 4 pontos. Segmentos C0 compartilham o último/primeiro ponto.
-        # Curva com k segmentos tem 3k+1 pontos.
-        if num_pts < 4:
-            status += f" Adicione mais {4 - num_pts} para o 1º segmento."
-        elif (num_pts - 1) % 3 == 0: # Completa um ou mais segmentos
-            num_segments = (num_pts - 1) // 3
-            status += f" {num_segments} segmento(s) completo(s). Adicione +3 para próximo, ou finalize."
-        else: # Em meio a um segmento
-            pts_in_current = (num_pts -1) % 3
-            needed_for_current = 3 - pts_in_current
-            status += f" Adicione mais {needed_for_current} para completar segmento atual."
-        status += " Botão direito para finalizar."
+        num_pts = len(self._buf.bezier_points)
+        status = (
+            _BEZIER_STATUS[num_pts]
+            if num_pts < len(_BEZIER_STATUS)
+            else _compute_bezier_status(num_pts)
+        )
         self.status_message_requested.emit(status, 0)
 
     def _update_bspline_status_message(self):
-        num_pts = len(self._current_bspline_points)
-        min_pts_for_default_degree = BSplineCurve.DEFAULT_DEGREE + 1
-        if num_pts == 0:
-            status = f"B-spline: Clique para adicionar pontos de controle (mín {min_pts_for_default_degree} para grau {BSplineCurve.DEFAULT_DEGREE})."
-        elif num_pts < min_pts_for_default_degree:
-            status = f"B-spline: {num_pts} ponto(s). Adicione mais {min_pts_for_default_degree - num_pts} para grau {BSplineCurve.DEFAULT_DEGREE}."
-        else:
-            status = f"B-spline: {num_pts} ponto(s) de controle."
-        status += " Botão direito para finalizar."
+        num_pts = self._buf.bspline_n
+        status = (
+            _BSPLINE_STATUS[num_pts]
+            if num_pts < len(_BSPLINE_STATUS)
+            else _compute_bspline_status(num_pts)
+        )
         self.status_message_requested.emit(status, 0)
 
 
     def handle_scene_right_click(self, scene_pos: QPointF):
         """Finaliza desenho de Polígono, Bézier ou B-spline."""
-        mode = self._state_manager.drawing_mode()
-        if mode in [DrawingMode.POLYGON, DrawingMode.BEZIER, DrawingMode.BSPLINE]:
+        if self._mode in _RIGHT_CLICK_FINISH_MODES:
             self._finish_current_drawing(commit=True)
 
     def handle_scene_mouse_move(self, scene_pos: QPointF):
-        """Atualiza preview durante movimento do mouse."""
-        mode = self._state_manager.drawing_mode()
-        if mode == DrawingMode.LINE and self._current_line_start:
-            self._update_line_preview(scene_pos)
-        elif mode == DrawingMode.POLYGON and self._current_polygon_points:
-            self._update_polygon_preview(scene_pos)
-        elif mode == DrawingMode.BEZIER and self._current_bezier_points:
-            self._update_bezier_preview(scene_pos)
-        elif mode == DrawingMode.BSPLINE and self._current_bspline_points:
-            self._update_bspline_preview(scene_pos)
+        """Agenda a atualização do preview com a posição atual do mouse."""
+        if self._active_preview is None:
+            return # Nenhum desenho em andamento: não há preview a atualizar
+        last_pos = self._last_preview_pos
+        if (
+            last_pos is not None
+            and abs(scene_pos.x() - last_pos.x()) < self.PREVIEW_MIN_DELTA
+            and abs(scene_pos.y() - last_pos.y()) < self.PREVIEW_MIN_DELTA
+        ):
+            return # Movimento sub-pixel: o preview não mudaria visivelmente
+        self._pending_mouse_pos = self._last_preview_pos = QPointF(scene_pos)
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _cancel_pending_preview(self):
+        """Descarta uma atualização de preview agendada e ainda não executada."""
+        self._preview_timer.stop()
+        self._pending_mouse_pos = None
+        self._last_preview_pos = None
+
+    def _flush_preview(self):
+        """Atualiza o preview com a última posição do mouse recebida."""
+        scene_pos = self._pending_mouse_pos
+        if scene_pos is None:
+            return
+        self._pending_mouse_pos = None
+        mode = self._active_preview
+        if mode is None:
+            return
+        update_preview = self._move_dispatch.get(mode)
+        if update_preview is not None:
+            update_preview(scene_pos)
 
 
     def cancel_current_drawing(self):
@@ -203,185 +491,218 @@ class DrawingController(QObject):
         self._finish_current_drawing(commit=False)
 
     def _update_line_preview(self, current_pos: QPointF):
-        if not self._current_line_start: return
-        line = QLineF(self._current_line_start.to_qpointf(), current_pos)
-        if self._temp_line_item is None:
-            self._temp_line_item = QGraphicsLineItem(line)
-            self._temp_line_item.setPen(self._temp_item_pen)
-            self._temp_line_item.setZValue(1000) # Garante que fica por cima
-            self._scene.addItem(self._temp_line_item)
-        else:
-            self._temp_line_item.setLine(line)
+        start = self._buf.line_start_qpoint
+        if start is None: return
+        self._temp_line_item.setLine(QLineF(start, current_pos))
+        self._preview_group.setVisible(True)
+
+    def _temp_items(self) -> Tuple[Union[QGraphicsLineItem, QGraphicsPathItem], ...]:
+        """Retorna todos os itens de preview reutilizáveis."""
+        return (self._temp_line_item, self._temp_path_item,
+                self._temp_rubber_band_item, self._temp_bezier_curve_item)
+
+    @staticmethod
+    def _sync_committed_item(item: QGraphicsPathItem, committed_path: QPainterPath):
+        """
+        Garante que o item de preview mostre o caminho confirmado.
+
+        O caminho só é reatribuído quando ganhou pontos (um clique), e não a
+        cada movimento do mouse.
+        """
+        if item.path().elementCount() != committed_path.elementCount():
+            item.setPath(committed_path)
+
+    def _update_rubber_band(self, anchor: QPointF, current_pos: QPointF, close_to: Optional[QPointF] = None):
+        """Atualiza o segmento 'anchor -> cursor' (e, opcionalmente, 'cursor -> close_to')."""
+        path = QPainterPath(anchor)
+        if _PATH_HAS_RESERVE:
+            path.reserve(3) # moveTo + até dois lineTo
+        path.lineTo(current_pos)
+        if close_to is not None:
+            path.lineTo(close_to)
+        self._temp_rubber_band_item.setPath(path)
+        self._preview_group.setVisible(True)
 
     def _update_polygon_preview(self, current_pos: QPointF):
-        if not self._current_polygon_points: return
-        path = QPainterPath(self._current_polygon_points[0].to_qpointf())
-        for point_model in self._current_polygon_points[1:]:
-            path.lineTo(point_model.to_qpointf())
-        path.lineTo(current_pos) # Linha até o cursor
-        
-        if not self._current_polygon_is_open: # Se for fechado, simula fechar com o primeiro ponto
-            path.lineTo(self._current_polygon_points[0].to_qpointf())
-
-        if self._temp_polygon_path_item is None:
-            self._temp_polygon_path_item = QGraphicsPathItem(path)
-            self._temp_polygon_path_item.setPen(self._temp_item_pen)
-            self._temp_polygon_path_item.setZValue(1000)
-            self._scene.addItem(self._temp_polygon_path_item)
-        else:
-            self._temp_polygon_path_item.setPath(path)
+        qpoints = self._buf.polygon_qpoints
+        if not qpoints: return
+        self._sync_committed_item(self._temp_path_item, self._buf.committed_polygon_path)
+        # Linha até o cursor; se for fechado, simula fechar com o primeiro ponto
+        close_to = None if self._buf.polygon_is_open else qpoints[0]
+        self._update_rubber_band(qpoints[-1], current_pos, close_to)
 
     def _update_bezier_preview(self, current_pos: QPointF):
-        # Para Bézier, o preview pode ser apenas o polígono de controle
-        if not self._current_bezier_points: return
-        
-        path = QPainterPath(self._current_bezier_points[0].to_qpointf())
-        # Desenha linhas entre os pontos de controle já clicados
-        for point_model in self._current_bezier_points[1:]:
-            path.lineTo(point_model.to_qpointf())
-        # Linha até a posição atual do mouse
-        path.lineTo(current_pos) 
-
-        if self._temp_bezier_path_item is None:
-            self._temp_bezier_path_item = QGraphicsPathItem(path)
-            self._temp_bezier_path_item.setPen(self._temp_item_pen)
-            self._temp_bezier_path_item.setZValue(1000)
-            self._scene.addItem(self._temp_bezier_path_item)
-        else:
-            self._temp_bezier_path_item.setPath(path)
+        # Polígono de controle + curva dos segmentos já completos
+        qpoints = self._buf.bezier_qpoints
+        if not qpoints: return
+
+        # Polígono de controle dos pontos já clicados + linha até a posição atual do mouse
+        self._sync_committed_item(self._temp_path_item, self._buf.committed_bezier_path)
+        self._sync_committed_item(self._temp_bezier_curve_item, self._buf.committed_bezier_curve_path)
+        self._update_rubber_band(qpoints[-1], current_pos)
+
+    def _bspline_preview_weights(self, num_pts: int) -> np.ndarray:
+        """
+        Retorna (do cache) os pesos da base para um preview com 'num_pts' pontos de controle.
+
+        Os pesos só mudam quando um ponto é clicado; a cada movimento do mouse
+        o preview é apenas o produto desses pesos pelos pontos de controle.
+        """
+        key = (num_pts, BSplineCurve.DEFAULT_DEGREE, BSplineCurve.DEFAULT_SAMPLES_PER_KNOT_SPAN)
+        weights = self._bspline_basis_cache.get(key)
+        if weights is None:
+            if len(self._bspline_basis_cache) >= self.BSPLINE_BASIS_CACHE_SIZE:
+                self._bspline_basis_cache.clear()
+            weights = BSplineCurve.basis_weights(*key)
+            self._bspline_basis_cache[key] = weights
+        return weights
 
     def _update_bspline_preview(self, current_pos: QPointF):
-        if not self._current_bspline_points: return
-
-        # Cria uma lista temporária de pontos incluindo a posição atual do mouse
-        temp_control_points = self._current_bspline_points + [Point(current_pos.x(), current_pos.y())]
-        
-        if len(temp_control_points) < 2: # Não pode desenhar curva ou linha
-            if self._temp_bspline_path_item: # Limpa preview anterior se houver
-                self._scene.removeItem(self._temp_bspline_path_item)
-                self._temp_bspline_path_item = None
+        num_committed = self._buf.bspline_n
+        if not num_committed: return
+
+        # Pontos de controle já clicados + a posição atual do mouse, escrita na
+        # linha livre do buffer (sem copiar os pontos já clicados)
+        num_pts = num_committed + 1
+        control_xy = self._buf.bspline_xy[:num_pts]
+        control_xy[num_committed] = (current_pos.x(), current_pos.y())
+
+        if num_pts < self._bspline_min_pts:
+            # Poucos pontos para o grau padrão (a curva ainda não pode ser
+            # finalizada): o preview é só o polígono de controle
+            self._temp_path_item.setPath(array_to_qpath(control_xy))
+            self._preview_group.setVisible(True)
             return
 
-        try:
-            # Tenta criar uma B-spline temporária para preview
-            # O grau pode ser ajustado para preview se houver poucos pontos
-            preview_degree = min(BSplineCurve.DEFAULT_DEGREE, len(temp_control_points) - 1)
-            if preview_degree < 1: preview_degree = 1 # Mínimo grau 1 (polilinha)
-
-            temp_bspline = BSplineCurve(temp_control_points, degree=preview_degree, color=self._temp_item_color)
-            preview_graphics_item = temp_bspline.create_graphics_item() # Retorna QGraphicsPathItem
-            
-            if self._temp_bspline_path_item is None:
-                self._temp_bspline_path_item = preview_graphics_item
-                self._temp_bspline_path_item.setPen(self._temp_item_pen) # Garante estilo de preview
-                self._temp_bspline_path_item.setZValue(1000)
-                self._scene.addItem(self._temp_bspline_path_item)
-            else:
-                self._temp_bspline_path_item.setPath(preview_graphics_item.path())
-        except ValueError: # Se não for possível criar B-spline (e.g. poucos pontos para o grau)
-            # Fallback: desenha apenas o polígono de controle como preview
-            path = QPainterPath(temp_control_points[0].to_qpointf())
-            for point_model in temp_control_points[1:]:
-                path.lineTo(point_model.to_qpointf())
-            
-            if self._temp_bspline_path_item is None:
-                self._temp_bspline_path_item = QGraphicsPathItem(path)
-                self._temp_bspline_path_item.setPen(self._temp_item_pen)
-                self._temp_bspline_path_item.setZValue(1000)
-                self._scene.addItem(self._temp_bspline_path_item)
-            else:
-                self._temp_bspline_path_item.setPath(path)
+        curve_xy = BSplineCurve.evaluate_with_weights(
+            self._bspline_preview_weights(num_pts), control_xy
+        )
+        # Caminho montado em lote a partir do array, sem um QPointF por amostra
+        self._temp_path_item.setPath(array_to_qpath(curve_xy))
+        self._preview_group.setVisible(True)
 
 
     def _finish_current_drawing(self, commit: bool = True):
         """Finaliza o desenho 2D atual, opcionalmente criando o objeto."""
-        mode = self._state_manager.drawing_mode()
-        color = self._state_manager.draw_color()
+        self._cancel_pending_preview()
         drawing_was_active = False # Flag para saber se algo foi resetado
 
         # Sempre limpa estado de polígono pendente
-        self._pending_first_polygon_point = None
-
-        if mode == DrawingMode.LINE:
-            if self._current_line_start: drawing_was_active = True
-            # Linha é finalizada no segundo clique esquerdo, aqui apenas reseta se commit=False (cancelar)
-            if not commit: self._current_line_start = None
-        
-        elif mode == DrawingMode.POLYGON:
-            if self._current_polygon_points: drawing_was_active = True
-            min_pts = 2 if self._current_polygon_is_open else 3
-            can_commit = len(self._current_polygon_points) >= min_pts
-            if commit and can_commit:
-                poly_data = Polygon(self._current_polygon_points.copy(),
-                                    is_open=self._current_polygon_is_open,
-                                    color=color, is_filled=self._current_polygon_is_filled)
-                self.object_ready_to_add.emit(poly_data)
-            elif commit and not can_commit:
-                QMessageBox.warning(None, "Pontos Insuficientes",
-                                    f"Polígono {'aberto' if self._current_polygon_is_open else 'fechado'} "
-                                    f"requer {min_pts} pontos (tem {len(self._current_polygon_points)}). Desenho não finalizado.")
-                return # Não reseta, permite continuar desenhando
-
-            if (commit and can_commit) or not commit: # Resetar se commit válido ou cancelamento
-                self._current_polygon_points = []
-                self._current_polygon_is_open = False
-                self._current_polygon_is_filled = False
-        
-        elif mode == DrawingMode.BEZIER:
-            if self._current_bezier_points: drawing_was_active = True
-            num_pts = len(self._current_bezier_points)
-            can_commit = num_pts >= 4 and (num_pts - 1) % 3 == 0
-            if commit and can_commit:
-                bezier_data = BezierCurve(self._current_bezier_points.copy(), color=color)
-                self.object_ready_to_add.emit(bezier_data)
-            elif commit and not can_commit:
-                # Lógica de mensagem de erro para Bézier pode ser mais detalhada
-                QMessageBox.warning(None, "Pontos Inválidos para Bézier",
-                                    f"Número de pontos ({num_pts}) inválido. Use 4, 7, 10,... Desenho não finalizado.")
-                return
-            if (commit and can_commit) or not commit:
-                self._current_bezier_points = []
-
-        elif mode == DrawingMode.BSPLINE:
-            if self._current_bspline_points: drawing_was_active = True
-            num_pts = len(self._current_bspline_points)
-            # B-spline precisa de pelo menos grau+1 pontos. Para grau padrão 3, são 4 pontos.
-            # Para grau 1 (polilinha), são 2 pontos.
-            min_pts_for_default_degree = BSplineCurve.DEFAULT_DEGREE + 1
-            can_commit = num_pts >= min_pts_for_default_degree 
-            if commit and can_commit:
-                bspline_data = BSplineCurve(self._current_bspline_points.copy(), color=color, degree=BSplineCurve.DEFAULT_DEGREE)
-                self.object_ready_to_add.emit(bspline_data)
-            elif commit and not can_commit:
-                 QMessageBox.warning(None, "Pontos Insuficientes para B-spline",
-                                    f"B-spline (grau {BSplineCurve.DEFAULT_DEGREE}) requer pelo menos {min_pts_for_default_degree} "
-                                    f"pontos de controle (tem {num_pts}). Desenho não finalizado.")
-                 return # Não reseta, permite continuar
-            if (commit and can_commit) or not commit:
-                self._current_bspline_points = []
+        self._buf.pending_first_polygon_point = None
 
+        finish = self._finish_dispatch.get(self._mode)
+        if finish is not None:
+            drawing_was_active = finish(commit, self._color)
+            if drawing_was_active is None:
+                return # Desenho não finalizado; mantém o estado para continuar
 
         if drawing_was_active or not commit: # Se algo estava ativo ou é um cancelamento explícito
             self._remove_temp_items()
             self.status_message_requested.emit("Pronto.", 1000)
             # Garante reset de todos os estados de desenho 2D
-            self._current_line_start = None
-            self._current_polygon_points = []
-            self._current_polygon_is_open = False
-            self._current_polygon_is_filled = False
-            self._current_bezier_points = []
-            self._current_bspline_points = []
-            self._pending_first_polygon_point = None
-
+            self._buf = DrawingBuffers()
+            self._active_preview = None
+
+    def _finish_line(self, commit: bool, color: QColor) -> Optional[bool]:
+        """
+        Finaliza (ou cancela) o desenho de linha.
+
+        Returns:
+            Optional[bool]: Se havia desenho ativo, ou None se o desenho não
+                            pôde ser finalizado e deve continuar.
+        """
+        # Linha é finalizada no segundo clique esquerdo; aqui só informa se havia desenho
+        return bool(self._buf.line_start)
+
+    def _simplified_polygon_points(self, min_pts: int) -> List[Point]:
+        """
+        Remove vértices quase duplicados/colineares de polígonos grandes.
+
+        Abaixo de POLYGON_SIMPLIFY_THRESHOLD os pontos clicados são mantidos
+        exatamente; acima disso aplica-se o Douglas-Peucker com
+        POLYGON_SIMPLIFY_TOLERANCE, preservando os objetos Point mantidos.
+        """
+        points = self._buf.polygon_points
+        if len(points) <= self.POLYGON_SIMPLIFY_THRESHOLD:
+            return points
+        xy = np.array([(p.x, p.y) for p in points], dtype=np.float64)
+        keep = simplify_mask(xy, self.POLYGON_SIMPLIFY_TOLERANCE)
+        if keep.all() or np.count_nonzero(keep) < min_pts:
+            return points
+        return [p for p, kept in zip(points, keep) if kept]
+
+    def _finish_polygon(self, commit: bool, color: QColor) -> Optional[bool]:
+        """Finaliza (ou cancela) o desenho de polígono. Retorno como em _finish_line."""
+        drawing_was_active = bool(self._buf.polygon_points)
+        min_pts = 2 if self._buf.polygon_is_open else 3
+        can_commit = len(self._buf.polygon_points) >= min_pts
+        if commit and can_commit:
+            # A lista é entregue ao modelo sem cópia: os buffers são trocados
+            # por novos logo em seguida, em _finish_current_drawing
+            poly_data = Polygon(self._simplified_polygon_points(min_pts),
+                                is_open=self._buf.polygon_is_open,
+                                color=color, is_filled=self._buf.polygon_is_filled)
+            self.object_ready_to_add.emit(poly_data)
+        elif commit and not can_commit:
+            self._warn("Pontos Insuficientes",
+                       f"Polígono {'aberto' if self._buf.polygon_is_open else 'fechado'} "
+                       f"requer {min_pts} pontos (tem {len(self._buf.polygon_points)}). Desenho não finalizado.")
+            return None # Não reseta, permite continuar desenhando
+
+        # Chega aqui se o commit foi válido ou é um cancelamento
+        # O reset dos buffers fica a cargo de _finish_current_drawing
+        return drawing_was_active
+
+    def _finish_bezier(self, commit: bool, color: QColor) -> Optional[bool]:
+        """Finaliza (ou cancela) o desenho de Bézier. Retorno como em _finish_line."""
+        drawing_was_active = bool(self._buf.bezier_points)
+        num_pts = len(self._buf.bezier_points)
+        can_commit = _bezier_state(num_pts)[2]
+        if commit and can_commit:
+            bezier_data = BezierCurve(self._buf.bezier_points, color=color)
+            self.object_ready_to_add.emit(bezier_data)
+        elif commit and not can_commit:
+            # Lógica de mensagem de erro para Bézier pode ser mais detalhada
+            self._warn("Pontos Inválidos para Bézier",
+                       f"Número de pontos ({num_pts}) inválido. Use 4, 7, 10,... Desenho não finalizado.")
+            return None
+        # O reset dos buffers fica a cargo de _finish_current_drawing
+        return drawing_was_active
+
+    def _finish_bspline(self, commit: bool, color: QColor) -> Optional[bool]:
+        """Finaliza (ou cancela) o desenho de B-spline. Retorno como em _finish_line."""
+        drawing_was_active = bool(self._buf.bspline_points)
+        num_pts = len(self._buf.bspline_points)
+        # B-spline precisa de pelo menos grau+1 pontos. Para grau padrão 3, são 4 pontos.
+        # Para grau 1 (polilinha), são 2 pontos.
+        min_pts_for_default_degree = self._bspline_min_pts
+        can_commit = num_pts >= min_pts_for_default_degree
+        if commit and can_commit:
+            bspline_data = BSplineCurve(self._buf.bspline_points, color=color, degree=BSplineCurve.DEFAULT_DEGREE)
+            self.object_ready_to_add.emit(bspline_data)
+        elif commit and not can_commit:
+            self._warn("Pontos Insuficientes para B-spline",
+                       f"B-spline (grau {BSplineCurve.DEFAULT_DEGREE}) requer pelo menos {min_pts_for_default_degree} "
+                       f"pontos de controle (tem {num_pts}). Desenho não finalizado.")
+            return None # Não reseta, permite continuar
+        # O reset dos buffers fica a cargo de _finish_current_drawing
+        return drawing_was_active
+
+    def _warn(self, title: str, text: str):
+        """
+        Informa um desenho que não pôde ser finalizado.
+
+        O texto vai para a barra de status e o sinal warning_requested permite
+        ao editor exibi-lo sem bloquear (nenhum QMessageBox modal é aberto aqui).
+        """
+        self.status_message_requested.emit(text, 5000)
+        self.warning_requested.emit(title, text)
 
     def _remove_temp_items(self) -> None:
-        """Remove todos os itens de preview temporários da cena."""
-        temp_items = [self._temp_line_item, self._temp_polygon_path_item, 
-                      self._temp_bezier_path_item, self._temp_bspline_path_item]
-        for item in temp_items:
-            if item and item.scene():
-                self._scene.removeItem(item)
-        self._temp_line_item = None
-        self._temp_polygon_path_item = None
-        self._temp_bezier_path_item = None
-        self._temp_bspline_path_item = None
\ No newline at end of file
+        """Oculta o grupo de preview e esvazia seus itens, que permanecem na cena para reuso."""
+        self._preview_group.setVisible(False)
+        self._temp_line_item.setLine(QLineF())
+        empty_path = QPainterPath()
+        self._temp_path_item.setPath(empty_path)
+        self._temp_rubber_band_item.setPath(empty_path)
+        self._temp_bezier_curve_item.setPath(empty_path)
@@ -1,5 +1,6 @@
 # graphics_editor/controllers/scene_controller.py
 import math
+import numpy as np
 from typing import List, Tuple, Dict, Union, Optional, Callable
 from enum import Enum
 from PyQt5.QtWidgets import (
@@ -41,6 +42,7 @@ AnyDataObject = Union[
 
 from ..state_manager import EditorStateManager, LineClippingAlgorithm, ProjectionMode
 from ..utils import clipping as clp  # Clipping 2D
+from ..utils.spatial_index import GridSpatialIndex, bounding_box, boxes_overlap
 from ..utils import transformations_3d as tf3d  # Transformações e projeção 3D
 
 SC_ORIGINAL_OBJECT_KEY = Qt.UserRole + 1
@@ -95,14 +97,25 @@ class SceneController(QObject):
         self._scene = scene
         self._state_manager = state_manager
         self._id_to_item_map: Dict[int, QGraphicsItem] = {}
+        # Caixas delimitadoras dos objetos 2D, para descartar antes do recorte
+        # os que estão totalmente fora da janela de recorte.
+        self._spatial_index_2d = GridSpatialIndex()
+        # Último recorte de cada objeto 2D: id -> (objeto, (janela, algoritmo), resultado).
+        # Invalidado quando a geometria do objeto muda ou quando ele sai da cena.
+        self._clip_cache_2d: Dict[
+            int, Tuple[AnyDataObject, tuple, Tuple[Optional[AnyDataObject], bool]]
+        ] = {}
 
         self._clip_rect_tuple_2d: clp.ClipRect = clp.qrectf_to_cliprect(
             self._state_manager.clip_rect()
         )
-        self._line_clipper_func_2d: Callable[
-            [clp.Point2D, clp.Point2D, clp.ClipRect],
-            Optional[Tuple[clp.Point2D, clp.Point2D]],
-        ] = self._get_2d_line_clipper_function()
+        # Recortadores especializados para a janela de recorte atual
+        self._line_clipper_func_2d: clp.LineClipper = (
+            self._get_2d_line_clipper_function()
+        )
+        self._polygon_clipper_func_2d: Callable[
+            [List[clp.Point2D]], List[clp.Point2D]
+        ] = clp.make_sutherland_hodgman(self._clip_rect_tuple_2d)
         self.bezier_clipping_samples_per_segment: int = 20
         self.bspline_clipping_samples: int = 100
 
@@ -124,6 +137,9 @@ class SceneController(QObject):
             self._state_manager.clip_rect()
         )
         self._line_clipper_func_2d = self._get_2d_line_clipper_function()
+        self._polygon_clipper_func_2d = clp.make_sutherland_hodgman(
+            self._clip_rect_tuple_2d
+        )
         self.refresh_all_object_clipping_and_projection()
 
     def refresh_all_object_clipping_and_projection(self):
@@ -131,21 +147,82 @@ class SceneController(QObject):
         Atualiza o recorte de todos os objetos na cena.
         """
         original_objects_to_refresh = list(self.get_all_original_data_objects())
+        visible_2d_ids = self._spatial_index_2d.query(self._clip_rect_tuple_2d)
+
+        # Pontos 2D são testados todos de uma vez com uma única máscara NumPy
+        points_2d = [obj for obj in original_objects_to_refresh if type(obj) is Point]
+        points_inside_ids = set()
+        if points_2d:
+            coords = np.array([(p.x, p.y) for p in points_2d], dtype=float)
+            inside_mask = clp.clip_points(coords, self._clip_rect_tuple_2d)
+            points_inside_ids = {
+                id(p) for p, inside in zip(points_2d, inside_mask) if inside
+            }
+
         for original_data_object in original_objects_to_refresh:
-            self.update_object_item(original_data_object, mark_modified=False)
+            item_id = id(original_data_object)
+            if type(original_data_object) is Point:
+                if item_id not in points_inside_ids:
+                    self._discard_object_item(item_id)
+                # Ponto dentro da janela: sua representação não muda com o recorte
+                continue
+            if item_id in self._spatial_index_2d and item_id not in visible_2d_ids:
+                # Caixa fora da janela de recorte: remove sem passar pelo recorte
+                self._discard_object_item(item_id)
+                continue
+            self.update_object_item(
+                original_data_object, mark_modified=False, geometry_changed=False
+            )
         self._scene.update()
 
-    def _get_2d_line_clipper_function(
-        self,
-    ) -> Callable[
-        [clp.Point2D, clp.Point2D, clp.ClipRect],
-        Optional[Tuple[clp.Point2D, clp.Point2D]],
-    ]:
+    def _index_2d_object(self, data_object: AnyDataObject):
+        """
+        Registra (ou atualiza) a caixa delimitadora de um objeto 2D no índice espacial.
+
+        Para curvas, usa os pontos de controle: a curva fica dentro do fecho convexo deles.
+
+        Args:
+            data_object: Objeto 2D cuja geometria foi criada ou alterada
+        """
+        if not isinstance(data_object, DATA_OBJECT_TYPES_2D):
+            return
+        self._clip_cache_2d.pop(id(data_object), None)
+        coords = data_object.get_coords()
+        box = bounding_box([coords] if isinstance(data_object, Point) else coords)
+        if box is None:
+            self._spatial_index_2d.remove(id(data_object))
+        else:
+            self._spatial_index_2d.insert(id(data_object), box)
+
+    def _discard_object_item(self, item_id: int):
+        """
+        Remove da cena o item de um objeto e esquece o objeto (mapa e índice espacial).
+
+        Args:
+            item_id: id() do objeto de dados original
+        """
+        graphics_item = self._id_to_item_map.pop(item_id, None)
+        if graphics_item and graphics_item.scene():
+            self._scene.removeItem(graphics_item)
+        self._forget_2d_object(item_id)
+
+    def _forget_2d_object(self, item_id: int):
+        """Remove um objeto do índice espacial e do cache de recorte 2D."""
+        self._spatial_index_2d.remove(item_id)
+        self._clip_cache_2d.pop(item_id, None)
+
+    def _get_2d_line_clipper_function(self) -> clp.LineClipper:
+        """
+        Cria o recortador de linha do algoritmo selecionado, especializado
+        para a janela de recorte atual (chamado uma vez por mudança de parâmetros).
+        """
         algo = self._state_manager.selected_line_clipper()
         if algo == LineClippingAlgorithm.COHEN_SUTHERLAND:
-            return clp.cohen_sutherland
+            return clp.make_cohen_sutherland(self._clip_rect_tuple_2d)
+        elif algo == LineClippingAlgorithm.LIANG_BARSKY:
+            return clp.make_liang_barsky(self._clip_rect_tuple_2d)
         else:
-            return clp.liang_barsky
+            return clp.make_hybrid_clip(self._clip_rect_tuple_2d)
 
     def _get_bezier_segment_clip_status(
         self, segment_cps: List[Point], clip_rect_tuple: clp.ClipRect
@@ -222,14 +299,14 @@ class SceneController(QObject):
             )
         return visible_segments_cps
 
-    def _clip_or_project_data_object(
+    def _clip_data_object_2d(
         self, original_data_object: AnyDataObject
     ) -> Tuple[Optional[AnyDataObject], bool]:
         """
-        Recorta um objeto de dados de acordo com a janela de visualização.
+        Recorta um objeto 2D contra a janela de recorte atual.
 
         Args:
-            original_data_object: Objeto a ser recortado
+            original_data_object: Objeto 2D a ser recortado
 
         Returns:
             Tupla contendo o objeto recortado (ou None se completamente fora da janela)
@@ -238,110 +315,149 @@ class SceneController(QObject):
         display_object: Optional[AnyDataObject] = None
         display_type_changed = False
 
-        if isinstance(original_data_object, DATA_OBJECT_TYPES_2D):
-            clip_rect_2d = self._clip_rect_tuple_2d
-            line_clipper_2d = self._line_clipper_func_2d
-            try:
-                if isinstance(original_data_object, Point):
-                    coords = original_data_object.get_coords()
-                    if clp.clip_point(coords, clip_rect_2d):
-                        display_object = original_data_object
-                elif isinstance(original_data_object, Line):
-                    p1c, p2c = (
-                        original_data_object.start.get_coords(),
-                        original_data_object.end.get_coords(),
+        clip_rect_2d = self._clip_rect_tuple_2d
+        line_clipper_2d = self._line_clipper_func_2d
+        bbox = self._spatial_index_2d.get_box(id(original_data_object))
+        if bbox is not None and not boxes_overlap(bbox, clip_rect_2d):
+            return None, False  # Totalmente fora: nada a recortar
+        try:
+            if isinstance(original_data_object, Point):
+                coords = original_data_object.get_coords()
+                if clp.clip_point(coords, clip_rect_2d):
+                    display_object = original_data_object
+            elif isinstance(original_data_object, Line):
+                p1c, p2c = (
+                    original_data_object.start.get_coords(),
+                    original_data_object.end.get_coords(),
+                )
+                clipped_line_coords = line_clipper_2d(p1c, p2c)
+                if clipped_line_coords:
+                    display_object = Line(
+                        Point(*clipped_line_coords[0]),
+                        Point(*clipped_line_coords[1]),
+                        original_data_object.color,
                     )
-                    clipped_line_coords = line_clipper_2d(p1c, p2c, clip_rect_2d)
-                    if clipped_line_coords:
-                        display_object = Line(
-                            Point(*clipped_line_coords[0]),
-                            Point(*clipped_line_coords[1]),
-                            original_data_object.color,
-                        )
-                elif isinstance(original_data_object, Polygon):
-                    clipped_poly_coords = clp.sutherland_hodgman(
-                        original_data_object.get_coords(), clip_rect_2d
+            elif isinstance(original_data_object, Polygon):
+                # Polígonos grandes seguem como array (N, 2): testes triviais e
+                # quickclip vetorizados no recortador
+                poly_coords = (
+                    original_data_object.get_coords_array()
+                    if len(original_data_object.points) >= clp.SH_QUICKCLIP_MIN_VERTICES
+                    else original_data_object.get_coords()
+                )
+                clipped_poly_coords = self._polygon_clipper_func_2d(poly_coords)
+                min_pts_required = 2 if original_data_object.is_open else 3
+                if len(clipped_poly_coords) >= min_pts_required:
+                    clipped_points_models = [
+                        Point(x, y, original_data_object.color)
+                        for x, y in clipped_poly_coords
+                    ]
+                    display_object = Polygon(
+                        clipped_points_models,
+                        is_open=original_data_object.is_open,
+                        color=original_data_object.color,
+                        is_filled=original_data_object.is_filled,
                     )
-                    min_pts_required = 2 if original_data_object.is_open else 3
-                    if len(clipped_poly_coords) >= min_pts_required:
-                        clipped_points_models = [
-                            Point(x, y, original_data_object.color)
-                            for x, y in clipped_poly_coords
+            elif isinstance(original_data_object, BezierCurve):
+                all_visible_cps_lists: List[List[Point]] = []
+                for i in range(original_data_object.get_num_segments()):
+                    segment_cps = original_data_object.get_segment_control_points(i)
+                    if segment_cps:
+                        visible_sub_cps = self._clip_bezier_segment_recursive(
+                            segment_cps, clip_rect_2d, 0
+                        )
+                        all_visible_cps_lists.extend(visible_sub_cps)
+                if all_visible_cps_lists:
+                    sampled_points_for_display: List[QPointF] = []
+                    for cps_list_for_segment in all_visible_cps_lists:
+                        temp_bezier = BezierCurve(
+                            cps_list_for_segment, original_data_object.color
+                        )
+                        segment_samples = temp_bezier.sample_curve(
+                            self.bezier_clipping_samples_per_segment
+                        )
+                        if (
+                            sampled_points_for_display
+                            and segment_samples
+                            and math.isclose(
+                                sampled_points_for_display[-1].x(),
+                                segment_samples[0].x(),
+                            )
+                            and math.isclose(
+                                sampled_points_for_display[-1].y(),
+                                segment_samples[0].y(),
+                            )
+                        ):
+                            sampled_points_for_display.extend(segment_samples[1:])
+                        elif segment_samples:
+                            sampled_points_for_display.extend(segment_samples)
+                    if len(sampled_points_for_display) >= 2:
+                        model_points_for_polygon = [
+                            Point(qp.x(), qp.y(), original_data_object.color)
+                            for qp in sampled_points_for_display
                         ]
                         display_object = Polygon(
-                            clipped_points_models,
-                            is_open=original_data_object.is_open,
+                            model_points_for_polygon,
+                            is_open=True,
                             color=original_data_object.color,
-                            is_filled=original_data_object.is_filled,
                         )
-                elif isinstance(original_data_object, BezierCurve):
-                    all_visible_cps_lists: List[List[Point]] = []
-                    for i in range(original_data_object.get_num_segments()):
-                        segment_cps = original_data_object.get_segment_control_points(i)
-                        if segment_cps:
-                            visible_sub_cps = self._clip_bezier_segment_recursive(
-                                segment_cps, clip_rect_2d, 0
-                            )
-                            all_visible_cps_lists.extend(visible_sub_cps)
-                    if all_visible_cps_lists:
-                        sampled_points_for_display: List[QPointF] = []
-                        for cps_list_for_segment in all_visible_cps_lists:
-                            temp_bezier = BezierCurve(
-                                cps_list_for_segment, original_data_object.color
-                            )
-                            segment_samples = temp_bezier.sample_curve(
-                                self.bezier_clipping_samples_per_segment
-                            )
-                            if (
-                                sampled_points_for_display
-                                and segment_samples
-                                and math.isclose(
-                                    sampled_points_for_display[-1].x(),
-                                    segment_samples[0].x(),
-                                )
-                                and math.isclose(
-                                    sampled_points_for_display[-1].y(),
-                                    segment_samples[0].y(),
-                                )
-                            ):
-                                sampled_points_for_display.extend(segment_samples[1:])
-                            elif segment_samples:
-                                sampled_points_for_display.extend(segment_samples)
-                        if len(sampled_points_for_display) >= 2:
-                            model_points_for_polygon = [
-                                Point(qp.x(), qp.y(), original_data_object.color)
-                                for qp in sampled_points_for_display
-                            ]
-                            display_object = Polygon(
-                                model_points_for_polygon,
-                                is_open=True,
-                                color=original_data_object.color,
-                            )
-                            display_type_changed = True
-                elif isinstance(original_data_object, BSplineCurve):
-                    sampled_coords = original_data_object.get_curve_points(
-                        self.bspline_clipping_samples
+                        display_type_changed = True
+            elif isinstance(original_data_object, BSplineCurve):
+                sampled_coords = original_data_object.get_curve_points(
+                    self.bspline_clipping_samples
+                )
+                if sampled_coords:
+                    clipped_bsp_coords = self._polygon_clipper_func_2d(
+                        sampled_coords
                     )
-                    if sampled_coords:
-                        clipped_bsp_coords = clp.sutherland_hodgman(
-                            sampled_coords, clip_rect_2d
+                    if len(clipped_bsp_coords) >= 2:
+                        points_for_polygon = [
+                            Point(x, y, original_data_object.color)
+                            for x, y in clipped_bsp_coords
+                        ]
+                        display_object = Polygon(
+                            points_for_polygon,
+                            is_open=True,
+                            color=original_data_object.color,
                         )
-                        if len(clipped_bsp_coords) >= 2:
-                            points_for_polygon = [
-                                Point(x, y, original_data_object.color)
-                                for x, y in clipped_bsp_coords
-                            ]
-                            display_object = Polygon(
-                                points_for_polygon,
-                                is_open=True,
-                                color=original_data_object.color,
-                            )
-                            display_type_changed = True
-            except Exception as e:
-                print(
-                    f"Erro durante o recorte 2D de {type(original_data_object).__name__}: {e}"
-                )
-                return None, False
+                        display_type_changed = True
+        except Exception as e:
+            print(
+                f"Erro durante o recorte 2D de {type(original_data_object).__name__}: {e}"
+            )
+            return None, False
+        return display_object, display_type_changed
+
+    def _clip_or_project_data_object(
+        self, original_data_object: AnyDataObject
+    ) -> Tuple[Optional[AnyDataObject], bool]:
+        """
+        Recorta um objeto de dados de acordo com a janela de visualização.
+
+        Args:
+            original_data_object: Objeto a ser recortado
+
+        Returns:
+            Tupla contendo o objeto recortado (ou None se completamente fora da janela)
+            e um booleano indicando se o tipo de exibição foi alterado
+        """
+        display_object: Optional[AnyDataObject] = None
+        display_type_changed = False
+
+        if isinstance(original_data_object, DATA_OBJECT_TYPES_2D):
+            # Resultado em cache enquanto geometria, janela e algoritmo não mudarem
+            item_id = id(original_data_object)
+            cache_key = (self._clip_rect_tuple_2d, self._line_clipper_func_2d)
+            cached = self._clip_cache_2d.get(item_id)
+            if (
+                cached is not None
+                and cached[0] is original_data_object
+                and cached[1] == cache_key
+            ):
+                return cached[2]
+            result = self._clip_data_object_2d(original_data_object)
+            self._clip_cache_2d[item_id] = (original_data_object, cache_key, result)
+            return result
         elif isinstance(original_data_object, DATA_OBJECT_TYPES_3D):
             vrp = self._state_manager.camera_vrp()
             target = self._state_manager.camera_target()
@@ -456,6 +572,7 @@ class SceneController(QObject):
         if item_id in self._id_to_item_map:
             return self._id_to_item_map[item_id]
         is_3d_original = isinstance(original_data_object, DATA_OBJECT_TYPES_3D)
+        self._index_2d_object(original_data_object)
         display_data_for_item_creation, display_type_changed_flag = (
             self._clip_or_project_data_object(original_data_object)
         )
@@ -493,7 +610,7 @@ class SceneController(QObject):
                     graphics_item.setData(
                         SC_IS_CLIPPED_BEZIER_AS_POLYGON_KEY, is_poly_from_2d_curve
                     )
-                    self._scene.addItem(graphics_item)
+                    self._add_graphics_item(graphics_item, is_3d_original)
                     self._id_to_item_map[item_id] = graphics_item
                     if mark_modified:
                         self.scene_modified.emit(True)
@@ -505,10 +622,29 @@ class SceneController(QObject):
                     f"Falha ao criar item gráfico para {type(original_data_object).__name__}: {e}\n"
                     f"Objeto de display: {type(display_data_for_item_creation)}",
                 )
+        self._forget_2d_object(item_id)  # Objeto não ficou na cena
         if mark_modified:
             self.scene_modified.emit(True)
         return None
 
+    def _add_graphics_item(self, graphics_item: QGraphicsItem, is_projected_3d: bool):
+        """
+        Adiciona um item gráfico de objeto à cena.
+
+        Itens 2D usam DeviceCoordinateCache: a geometria só muda quando o objeto
+        é editado, então repinturas causadas por outros itens (por exemplo, o
+        preview do desenho passando por cima) reaproveitam a imagem em cache em
+        vez de redesenhar o contorno. Itens 3D projetados são refeitos a cada
+        mudança de câmera e não se beneficiam do cache.
+
+        Args:
+            graphics_item: Item a ser adicionado
+            is_projected_3d: Se o item é a projeção de um objeto 3D
+        """
+        if not is_projected_3d:
+            graphics_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._scene.addItem(graphics_item)
+
     def _get_projected_lines_for_GeometricShape3D(
         self, GeometricShape3D: GeometricShape3D
     ) -> List[QLineF]:
@@ -547,6 +683,7 @@ class SceneController(QObject):
         )
         model_m = tf3d.create_identity_matrix_3d()
 
+        segments_2d: List[Tuple[float, float, float, float]] = []
         for p1_3d, p2_3d in GeometricShape3D.segments:
             q_p1 = tf3d.project_point_3d_to_qpointf(
                 p1_3d.get_coords(), model_m, view_m, proj_m, viewport_rect_params
@@ -555,14 +692,26 @@ class SceneController(QObject):
                 p2_3d.get_coords(), model_m, view_m, proj_m, viewport_rect_params
             )
             if q_p1 and q_p2:
-                line_2d_coords = ((q_p1.x(), q_p1.y()), (q_p2.x(), q_p2.y()))
-                clipped_2d_seg = self._line_clipper_func_2d(
-                    line_2d_coords[0], line_2d_coords[1], self._clip_rect_tuple_2d
-                )
+                segments_2d.append((q_p1.x(), q_p1.y(), q_p2.x(), q_p2.y()))
+
+        if (
+            self._state_manager.selected_line_clipper()
+            == LineClippingAlgorithm.COHEN_SUTHERLAND
+        ):
+            for x1, y1, x2, y2 in segments_2d:
+                clipped_2d_seg = self._line_clipper_func_2d((x1, y1), (x2, y2))
                 if clipped_2d_seg:
                     projected_lines.append(
                         QLineF(QPointF(*clipped_2d_seg[0]), QPointF(*clipped_2d_seg[1]))
                     )
+        elif segments_2d:
+            # Liang-Barsky/híbrido: recorta todos os segmentos num único lote
+            clipped, visible = clp.clip_segments(
+                np.array(segments_2d, dtype=np.float64), self._clip_rect_tuple_2d
+            )
+            projected_lines.extend(
+                QLineF(x1, y1, x2, y2) for x1, y1, x2, y2 in clipped[visible].tolist()
+            )
         return projected_lines
 
     def remove_data_objects(
@@ -582,6 +731,7 @@ class SceneController(QObject):
         for data_obj in data_objects_to_remove:
             item_id = id(data_obj)
             graphics_item = self._id_to_item_map.pop(item_id, None)
+            self._forget_2d_object(item_id)
             if graphics_item and graphics_item.scene():
                 self._scene.removeItem(graphics_item)
                 removed_count += 1
@@ -602,11 +752,16 @@ class SceneController(QObject):
                 self._scene.removeItem(item)
         cleared_count = len(self._id_to_item_map)
         self._id_to_item_map.clear()
+        self._spatial_index_2d.clear()
+        self._clip_cache_2d.clear()
         if mark_modified:
             self.scene_modified.emit(cleared_count > 0)
 
     def update_object_item(
-        self, original_modified_data_object: AnyDataObject, mark_modified: bool = True
+        self,
+        original_modified_data_object: AnyDataObject,
+        mark_modified: bool = True,
+        geometry_changed: bool = True,
     ):
         """
         Atualiza a representação visual de um objeto na cena.
@@ -614,10 +769,14 @@ class SceneController(QObject):
         Args:
             original_modified_data_object: Objeto modificado a ser atualizado
             mark_modified: Se True, marca a cena como modificada
+            geometry_changed: Se True, a geometria do objeto mudou (ex.: transformação)
+                e sua caixa no índice espacial é recalculada
         """
         if not isinstance(original_modified_data_object, DATA_OBJECT_TYPES_ALL):
             return
         item_id = id(original_modified_data_object)
+        if geometry_changed:
+            self._index_2d_object(original_modified_data_object)
         current_graphics_item = self._id_to_item_map.get(item_id)
         is_3d_original = isinstance(original_modified_data_object, DATA_OBJECT_TYPES_3D)
         new_display_representation, display_type_changed = (
@@ -627,17 +786,23 @@ class SceneController(QObject):
         if not current_graphics_item or not current_graphics_item.scene():
             if new_display_representation:
                 self.add_object(original_modified_data_object, mark_modified)
-            elif mark_modified:
-                self.scene_modified.emit(True)
+            else:
+                self._forget_2d_object(item_id)
+                if mark_modified:
+                    self.scene_modified.emit(True)
             return
         try:
             if new_display_representation is None:
-                if current_graphics_item.scene():
-                    self._scene.removeItem(current_graphics_item)
-                if item_id in self._id_to_item_map:
-                    del self._id_to_item_map[item_id]
+                self._discard_object_item(item_id)
                 if mark_modified:
                     self.scene_modified.emit(True)
+            elif (
+                not geometry_changed
+                and not is_3d_original
+                and new_display_representation
+                is current_graphics_item.data(SC_CURRENT_REPRESENTATION_KEY)
+            ):
+                return  # Recorte veio do cache: o item já mostra esta representação
             else:
                 required_qitem_type = self._get_required_qgraphicsitem_type(
                     new_display_representation, is_3d_original
@@ -696,11 +861,10 @@ class SceneController(QObject):
                         new_graphics_item.setData(
                             SC_IS_CLIPPED_BEZIER_AS_POLYGON_KEY, is_poly_from_curve_upd
                         )
-                        self._scene.addItem(new_graphics_item)
+                        self._add_graphics_item(new_graphics_item, is_3d_original)
                         self._id_to_item_map[item_id] = new_graphics_item
                     else:
-                        if item_id in self._id_to_item_map:
-                            del self._id_to_item_map[item_id]
+                        self._discard_object_item(item_id)
                 else:
                     current_graphics_item.prepareGeometryChange()
                     current_graphics_item.setData(
@@ -220,6 +220,8 @@ class GraphicsEditor(QMainWindow):
             coord_callback=self._open_coordinate_input_dialog,
             transform_callback=self._open_transformation_dialog,
             clipper_callback=self._set_line_clipper,
+            polygon_callback=self._state_manager.set_polygon_defaults,
+            polygon_prompt_callback=self._state_manager.set_polygon_prompt_enabled,
         )
         self._ui_manager.setup_status_bar(zoom_callback=self._on_zoom_slider_changed)
 
@@ -260,6 +262,12 @@ class GraphicsEditor(QMainWindow):
         self._state_manager.line_clipper_changed.connect(
             self._ui_manager.update_clipper_selection
         )
+        self._state_manager.polygon_defaults_changed.connect(
+            self._ui_manager.update_polygon_defaults_selection
+        )
+        self._state_manager.polygon_prompt_changed.connect(
+            self._ui_manager.update_polygon_prompt_selection
+        )
         self._state_manager.clip_rect_changed.connect(self._update_clip_rect_item)
         self._state_manager.drawing_mode_changed.connect(self._update_view_interaction)
         self._state_manager.drawing_mode_changed.connect(
@@ -286,6 +294,7 @@ class GraphicsEditor(QMainWindow):
         self._drawing_controller.polygon_properties_query_requested.connect(
             self._prompt_polygon_properties
         )
+        self._drawing_controller.warning_requested.connect(self._show_warning_async)
         self._transformation_controller.object_transformed.connect(
             self._scene_controller.update_object_item
         )
@@ -347,15 +356,8 @@ class GraphicsEditor(QMainWindow):
         Args:
             scene_pos: Posição do clique na cena
         """
-        mode = self._state_manager.drawing_mode()
-        if mode in [
-            DrawingMode.POINT,
-            DrawingMode.LINE,
-            DrawingMode.POLYGON,
-            DrawingMode.BEZIER,
-            DrawingMode.BSPLINE,
-        ]:
-            self._drawing_controller.handle_scene_left_click(scene_pos)
+        # O DrawingController ignora modos sem desenho (modo mantido em cache)
+        self._drawing_controller.handle_scene_left_click(scene_pos)
 
     def _handle_scene_right_click(self, scene_pos: QPointF):
         """
@@ -364,9 +366,7 @@ class GraphicsEditor(QMainWindow):
         Args:
             scene_pos: Posição do clique na cena
         """
-        mode = self._state_manager.drawing_mode()
-        if mode in [DrawingMode.POLYGON, DrawingMode.BEZIER, DrawingMode.BSPLINE]:
-            self._drawing_controller.handle_scene_right_click(scene_pos)
+        self._drawing_controller.handle_scene_right_click(scene_pos)
 
     def _handle_scene_mouse_move(self, scene_pos: QPointF):
         """
@@ -375,14 +375,8 @@ class GraphicsEditor(QMainWindow):
         Args:
             scene_pos: Posição atual do mouse na cena
         """
-        mode = self._state_manager.drawing_mode()
-        if mode in [
-            DrawingMode.LINE,
-            DrawingMode.POLYGON,
-            DrawingMode.BEZIER,
-            DrawingMode.BSPLINE,
-        ]:
-            self._drawing_controller.handle_scene_mouse_move(scene_pos)
+        # Sem desenho em andamento, o controlador retorna de imediato
+        self._drawing_controller.handle_scene_mouse_move(scene_pos)
 
     def _handle_mouse_drag_3d(
         self,
@@ -515,11 +509,11 @@ class GraphicsEditor(QMainWindow):
 
     def _set_line_clipper(self, algorithm: LineClippingAlgorithm):
         self._state_manager.set_selected_line_clipper(algorithm)
-        algo_name = (
-            "Cohen-Sutherland"
-            if algorithm == LineClippingAlgorithm.COHEN_SUTHERLAND
-            else "Liang-Barsky"
-        )
+        algo_name = {
+            LineClippingAlgorithm.COHEN_SUTHERLAND: "Cohen-Sutherland",
+            LineClippingAlgorithm.LIANG_BARSKY: "Liang-Barsky",
+            LineClippingAlgorithm.HYBRID: "Híbrido (CS + LB)",
+        }[algorithm]
         self._set_status_message(f"Clipping de linha 2D: {algo_name}", 2000)
 
     def _on_zoom_slider_changed(self, value: int):
@@ -922,39 +916,106 @@ class GraphicsEditor(QMainWindow):
 
     def _prompt_polygon_properties(self):
         """
-        Solicita propriedades adicionais para um polígono.
-        Permite definir preenchimento e outras características.
+        Define as propriedades (aberto/preenchido) de um novo polígono.
+
+        Por padrão aplica, sem diálogo, as opções de "Polígono (2D)" da barra
+        de ferramentas. Com "Perguntar sempre" ativado, pergunta a cada
+        polígono em caixas de mensagem modais à janela abertas com open() (sem
+        laço de eventos aninhado); as opções atuais são o botão padrão e as
+        respostas atualizam a barra de ferramentas.
         """
-        type_reply = QMessageBox.question(
-            self,
+        last_open, last_filled = self._state_manager.polygon_defaults()
+        if not self._state_manager.polygon_prompt_enabled():
+            self._drawing_controller.set_pending_polygon_properties(
+                last_open, last_filled
+            )
+            return
+        self._ask_question_async(
             "Tipo de Polígono 2D",
             "Deseja criar uma Polilinha (ABERTA)?\n\n"
             "- Sim: Polilinha (>= 2 pontos).\n"
             "- Não: Polígono Fechado (>= 3 pontos).\n\n"
             "(Clique com o botão direito para finalizar)",
-            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
-            QMessageBox.No,
+            self._on_polygon_type_answered,
+            QMessageBox.Yes if last_open else QMessageBox.No,
         )
+
+    def _on_polygon_type_answered(self, type_reply: int):
+        """Recebe a resposta do tipo de polígono e, se fechado, pergunta o preenchimento."""
         if type_reply == QMessageBox.Cancel:
             self._drawing_controller.set_pending_polygon_properties(False, False, True)
             return
-        is_open = type_reply == QMessageBox.Yes
-        is_filled = False
-        if not is_open:
-            fill_reply = QMessageBox.question(
-                self,
-                "Preenchimento",
-                "Deseja preencher o polígono fechado?",
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
-                QMessageBox.No,
+        if type_reply == QMessageBox.Yes:  # Polilinha aberta, nunca preenchida
+            self._state_manager.set_polygon_defaults(True, False)
+            self._drawing_controller.set_pending_polygon_properties(True, False)
+            return
+        _, last_filled = self._state_manager.polygon_defaults()
+        self._ask_question_async(
+            "Preenchimento",
+            "Deseja preencher o polígono fechado?",
+            self._on_polygon_fill_answered,
+            QMessageBox.Yes if last_filled else QMessageBox.No,
+        )
+
+    def _on_polygon_fill_answered(self, fill_reply: int):
+        """Recebe a resposta de preenchimento de um polígono fechado."""
+        if fill_reply == QMessageBox.Cancel:
+            self._drawing_controller.set_pending_polygon_properties(False, False, True)
+            return
+        is_filled = fill_reply == QMessageBox.Yes
+        self._state_manager.set_polygon_defaults(False, is_filled)
+        self._drawing_controller.set_pending_polygon_properties(False, is_filled)
+
+    def _show_warning_async(self, title: str, text: str):
+        """
+        Exibe um aviso sem bloquear o laço de eventos (QMessageBox.open()).
+
+        Args:
+            title: Título do aviso.
+            text: Texto do aviso.
+        """
+        box = QMessageBox(QMessageBox.Warning, title, text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
+
+    def _ask_question_async(
+        self,
+        title: str,
+        text: str,
+        callback: Callable[[int], None],
+        default_button: int = QMessageBox.No,
+    ):
+        """
+        Exibe uma pergunta Sim/Não/Cancelar sem bloquear o laço de eventos.
+
+        Args:
+            title: Título da caixa de mensagem.
+            text: Texto da pergunta.
+            callback: Chamado com o QMessageBox.StandardButton escolhido
+                      (Cancel se a caixa for fechada sem resposta).
+            default_button: Botão acionado pelo Enter.
+        """
+        box = QMessageBox(
+            QMessageBox.Question,
+            title,
+            text,
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+            self,
+        )
+        box.setDefaultButton(default_button)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+
+        def on_finished(_result: int):
+            clicked = box.clickedButton()
+            reply = (
+                box.standardButton(clicked)
+                if clicked is not None
+                else QMessageBox.Cancel
             )
-            if fill_reply == QMessageBox.Cancel:
-                self._drawing_controller.set_pending_polygon_properties(
-                    False, False, True
-                )
-                return
-            is_filled = fill_reply == QMessageBox.Yes
-        self._drawing_controller.set_pending_polygon_properties(is_open, is_filled)
+            callback(reply)
+
+        box.finished.connect(on_finished)
+        box.open()
 
     def _create_object_3d_at_center(self, obj: GeometricShape3D, name_str: str):
         """Adiciona um objeto 3D e tenta centralizar a câmera nele (simplificado)."""
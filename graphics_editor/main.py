@@ -1,14 +1,38 @@
 # graphics_editor/main.py
 import sys
-import os
+import functools
 import traceback
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt, QLocale
+from PyQt5.QtCore import Qt, QLocale, QFile
 from PyQt5.QtGui import QIcon
 
-# Define the base path for resources relative to this file's location
-# This makes it work correctly whether run as a script or imported module
-_RESOURCE_PATH = os.path.join(os.path.dirname(__file__), "resources")
+from .resources import icon_path
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app() -> QApplication:
+    """
+    Cria (uma única vez) e retorna a instância de QApplication.
+
+    Os atributos de alta resolução precisam ser definidos antes da criação da
+    QApplication; se uma instância já existir (ex.: criada por testes), ela é
+    reutilizada e os atributos não são redefinidos.
+
+    Returns:
+        QApplication: A instância da aplicação.
+    """
+    existing = QApplication.instance()
+    if existing is not None:
+        return existing
+
+    # Enable high DPI scaling for better visuals on high-resolution displays
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
+    # Set the default locale for number formatting etc. to the system's locale
+    QLocale.setDefault(QLocale.system())
+
+    return QApplication(sys.argv)
 
 
 def main():
@@ -16,12 +40,10 @@ def main():
     Função principal que configura e executa a aplicação do editor gráfico.
     
     Esta função:
-    1. Configura o ambiente Qt com suporte a alta resolução
-    2. Define a localização padrão do sistema
-    3. Inicializa a aplicação Qt
-    4. Configura o ícone da aplicação
-    5. Inicializa a janela principal do editor
-    6. Trata possíveis erros durante a inicialização
+    1. Obtém a aplicação Qt via _get_app() (alta resolução e localização padrão)
+    2. Configura o ícone da aplicação
+    3. Inicializa a janela principal do editor
+    4. Trata possíveis erros durante a inicialização
     
     Returns:
         None
@@ -29,23 +51,15 @@ def main():
     Raises:
         SystemExit: Se houver erro crítico durante a inicialização
     """
-    # Enable high DPI scaling for better visuals on high-resolution displays
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-
-    # Set the default locale for number formatting etc. to the system's locale
-    QLocale.setDefault(QLocale.system())
-
-    # Create the QApplication instance
-    app = QApplication(sys.argv)
+    app = _get_app()
 
     # Set application icon (optional)
-    # Ensure 'app_icon.png' exists in the 'resources/icons' directory
-    icon_path = os.path.join(_RESOURCE_PATH, "icons", "app_icon.png")
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    # Ensure 'app_icon.png' exists in the 'resources/icons' directory (and icons.qrc)
+    app_icon_path = icon_path("app_icon.png")
+    if QFile.exists(app_icon_path):
+        app.setWindowIcon(QIcon(app_icon_path))
     else:
-        print(f"Warning: Application icon not found at {icon_path}")
+        print(f"Warning: Application icon not found at {app_icon_path}")
 
     # --- Import the main window inside the try block ---
     # This helps catch import errors related to dependencies or structure
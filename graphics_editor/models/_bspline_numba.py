@@ -0,0 +1,61 @@
+"""
+Kernel de avaliação de B-splines compilado com Numba (opcional).
+
+Este módulo só é importado por `bspline_curve.py` quando o Numba está
+instalado; caso contrário a importação falha com ImportError e a avaliação
+vetorizada com NumPy é usada.
+"""
+
+# graphics_editor/models/_bspline_numba.py
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def de_boor_kernel(control_points, knots, degree, us, out):
+    """
+    Avalia a B-spline em cada parâmetro de `us` pelo algoritmo de de Boor.
+
+    Args:
+        control_points: Array (n+1, 2) float64 com os pontos de controle.
+        knots: Vetor de nós float64 (n + grau + 2 valores).
+        degree: Grau da curva.
+        us: Parâmetros (já dentro do domínio da curva).
+        out: Array (len(us), 2) float64 que recebe os pontos avaliados.
+    """
+    p = degree
+    n = control_points.shape[0] - 1
+    d = np.empty((p + 1, 2), dtype=np.float64)
+    for s in range(us.shape[0]):
+        u = us[s]
+        # Intervalo de nós [knots[k], knots[k+1]) que contém u, limitado a [p, n]
+        k = np.searchsorted(knots, u, side="right") - 1
+        if k < p:
+            k = p
+        elif k > n:
+            k = n
+        for j in range(p + 1):
+            d[j, 0] = control_points[k - p + j, 0]
+            d[j, 1] = control_points[k - p + j, 1]
+        for r in range(1, p + 1):
+            for j in range(p, r - 1, -1):
+                left = knots[j + k - p]
+                denominator = knots[j + 1 + k - r] - left
+                alpha = (u - left) / denominator if denominator != 0.0 else 0.0
+                d[j, 0] = (1.0 - alpha) * d[j - 1, 0] + alpha * d[j, 0]
+                d[j, 1] = (1.0 - alpha) * d[j - 1, 1] + alpha * d[j, 1]
+        out[s, 0] = d[p, 0]
+        out[s, 1] = d[p, 1]
+
+
+def _warm_up():
+    """Força a compilação (ou carga do cache) do kernel na importação."""
+    control_points = np.array(
+        [[0.0, 0.0], [1.0, 2.0], [2.0, 2.0], [3.0, 0.0]], dtype=np.float64
+    )
+    knots = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0], dtype=np.float64)
+    us = np.array([0.0, 0.5, 1.0], dtype=np.float64)
+    de_boor_kernel(control_points, knots, 3, us, np.empty((3, 2), dtype=np.float64))
+
+
+_warm_up()
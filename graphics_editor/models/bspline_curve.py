@@ -7,12 +7,54 @@ from PyQt5.QtWidgets import QGraphicsPathItem, QGraphicsItem
 import math  # Adicionado para math.isclose
 
 from .point import Point  # Importação explícita
+from ..utils.qpath import array_to_qpath
+
+# Kernel Numba opcional para avaliar muitos parâmetros de uma vez.
+# O módulo compila o kernel já na importação (_warm_up); qualquer falha
+# nessa etapa (não só a ausência do Numba) recai em _de_boor_numpy.
+try:
+    from ._bspline_numba import de_boor_kernel as _de_boor_kernel
+except Exception:
+    _de_boor_kernel = None
+
+
+def _de_boor_numpy(
+    control_points: np.ndarray, knots: np.ndarray, p: int, us: np.ndarray
+) -> np.ndarray:
+    """
+    Algoritmo de de Boor vetorizado com NumPy sobre todos os parâmetros.
+
+    Args:
+        control_points: Array (n+1, D) com os pontos de controle (D qualquer).
+        knots: Vetor de nós.
+        p: Grau da curva.
+        us: Parâmetros já dentro do domínio da curva.
+
+    Returns:
+        np.ndarray: Array (len(us), D) com os pontos avaliados.
+    """
+    n = len(control_points) - 1
+    # Intervalo de nós [knots[k], knots[k+1]) que contém cada u, limitado a [p, n]
+    k = np.clip(np.searchsorted(knots, us, side="right") - 1, p, n)
+    d = control_points[k[:, None] - p + np.arange(p + 1)]  # (len(us), p+1, D)
+    for r in range(1, p + 1):
+        for j in range(p, r - 1, -1):
+            left = knots[j + k - p]
+            denominator = knots[j + 1 + k - r] - left
+            alpha = np.divide(
+                us - left,
+                denominator,
+                out=np.zeros_like(us),
+                where=denominator != 0.0,
+            )[:, None]
+            d[:, j] = (1.0 - alpha) * d[:, j - 1] + alpha * d[:, j]
+    return d[:, p]
 
 
 class BSplineCurve:
     """
     Representa uma curva B-spline, definida por pontos de controle, grau e vetor de nós.
-    Utiliza a fórmula de Cox-de Boor para avaliação.
+    Utiliza o algoritmo de de Boor (equivalente à fórmula de Cox-de Boor) para avaliação.
     """
 
     GRAPHICS_WIDTH = 2  # Espessura visual da curva
@@ -92,25 +134,29 @@ class BSplineCurve:
         """
         Gera um vetor de nós uniforme e "clamped" (aberto com multiplicidade p+1 nas extremidades).
         Isso faz a curva interpolar os pontos de controle inicial e final.
+        """
+        self.knots = self._clamped_uniform_knots(len(self.control_points), self.degree)
+
+    @staticmethod
+    def _clamped_uniform_knots(n_plus_1: int, p: int) -> np.ndarray:
+        """
+        Monta o vetor de nós uniforme e "clamped" para 'n_plus_1' pontos de controle e grau 'p'.
         O vetor de nós U = {u_0, ..., u_m} tem m+1 nós.
         m = n_idx + p + 1, onde 'n_idx' é o índice do último ponto de controle (P_{n_idx}),
-        então n_idx = len(control_points) - 1. 'p' é o grau.
-        Total de nós = (len(control_points) - 1) + degree + 1 + 1 = len(control_points) + degree + 1.
+        então n_idx = n_plus_1 - 1.
+        Total de nós = (n_plus_1 - 1) + p + 1 + 1 = n_plus_1 + p + 1.
         """
-        n_plus_1 = len(self.control_points)  # Número de pontos de controle
-        p = self.degree  # Grau da curva
-
         num_knots = n_plus_1 + p + 1
-        self.knots = np.zeros(num_knots, dtype=float)
+        knots = np.zeros(num_knots, dtype=float)
 
         # Primeiros p+1 nós são 0 (clamped no início)
         for i in range(p + 1):
-            self.knots[i] = 0.0
+            knots[i] = 0.0
 
         # Últimos p+1 nós são 1 (clamped no final)
         # Índices de num_knots - (p+1) até num_knots - 1
         for i in range(num_knots - p - 1, num_knots):
-            self.knots[i] = 1.0
+            knots[i] = 1.0
 
         # Nós internos são uniformemente espaçados entre 0 e 1.
         # Número de segmentos internos do vetor de nós: (n_plus_1 - 1) - p + 1 = n_plus_1 - p
@@ -125,51 +171,40 @@ class BSplineCurve:
             #   Intervalo [0,1] dividido em (n_plus_1 - p) partes. (4-2 = 2 partes). u3 = 0.5.
             step = 1.0 / (n_plus_1 - p)
             for i in range(num_internal_knots_to_generate):
-                self.knots[p + 1 + i] = (i + 1) * step
+                knots[p + 1 + i] = (i + 1) * step
+        return knots
 
-    def _cox_de_boor(self, u: float, i: int, p: int) -> float:
+    def _evaluate_many(self, us: np.ndarray) -> np.ndarray:
         """
-        Calcula o valor da i-ésima função base B-spline N_{i,p}(u) de grau p no parâmetro u.
-        Implementação recursiva da fórmula de Cox-de Boor.
+        Avalia a curva em vários parâmetros de uma vez pelo algoritmo de de Boor.
+
+        Em vez de somar todas as funções base N_{i,p}(u) (Cox-de Boor recursivo),
+        interpola apenas os p+1 pontos de controle que influenciam o intervalo
+        de nós de cada u. Usa o kernel Numba se disponível; caso contrário, a
+        mesma interpolação é vetorizada com NumPy sobre todos os parâmetros.
 
         Args:
-            u: Parâmetro (valor do nó) onde a função base é avaliada.
-            i: Índice do ponto de controle associado (0 <= i <= n_idx).
-            p: Grau da função base (p >= 0).
+            us: Parâmetros da curva. São limitados ao domínio válido
+                [knots[degree], knots[len(control_points)]].
 
         Returns:
-            float: Valor da função base N_{i,p}(u).
+            np.ndarray: Array (len(us), 2) com as coordenadas (x, y) avaliadas.
         """
-        # Caso base da recursão
-        if p == 0:
-            # N_{i,0}(u) é 1 se u_i <= u < u_{i+1}, e 0 caso contrário.
-            # Tratamento especial para o último nó u_m=1.0 quando u = u_m
-            # Se u_i <= u < u_{i+1}, ou se u == u_{i+1} == u_m (último nó)
-            # e u_i <= u. Isso garante que N_{n,0}(1.0) = 1 para nós clampados.
-            if (self.knots[i] <= u < self.knots[i + 1]) or (
-                math.isclose(u, self.knots[i + 1])
-                and math.isclose(self.knots[i + 1], self.knots[-1])
-                and self.knots[i] <= u
-            ):
-                return 1.0
-            return 0.0
-
-        # Termos da recursão
-        term1, term2 = 0.0, 0.0
-
-        denominator1 = self.knots[i + p] - self.knots[i]
-        if abs(denominator1) > self.EPSILON:  # Evita divisão por zero
-            term1 = ((u - self.knots[i]) / denominator1) * self._cox_de_boor(
-                u, i, p - 1
-            )
+        p = self.degree
+        n = len(self.control_points) - 1
+        knots = self.knots
+        us = np.clip(np.asarray(us, dtype=float), knots[p], knots[n + 1])
+        us[np.isclose(us, 1.0)] = 1.0  # Garante que 1.0 é tratado corretamente
+        control_points = np.array(
+            [(pt.x, pt.y) for pt in self.control_points], dtype=float
+        )
 
-        denominator2 = self.knots[i + p + 1] - self.knots[i + 1]
-        if abs(denominator2) > self.EPSILON:  # Evita divisão por zero
-            term2 = ((self.knots[i + p + 1] - u) / denominator2) * self._cox_de_boor(
-                u, i + 1, p - 1
-            )
+        if _de_boor_kernel is not None:
+            out = np.empty((len(us), 2), dtype=float)
+            _de_boor_kernel(control_points, knots, p, us, out)
+            return out
 
-        return term1 + term2
+        return _de_boor_numpy(control_points, knots, p, us)
 
     def _evaluate(self, u: float) -> Tuple[float, float]:
         """
@@ -183,21 +218,8 @@ class BSplineCurve:
         Returns:
             Tuple[float, float]: Coordenadas (x, y) do ponto na curva.
         """
-        # O domínio da curva é [u_p, u_{n+1}] ou [u_p, u_{m-p-1}] onde m+1 é o num_knots
-        # m = n_idx + p + 1.  Então u_{n_idx+1} = u_{m-p}
-        # Para nós clampados, este intervalo é [0, 1].
-        u_clamped = np.clip(
-            u, self.knots[self.degree], self.knots[len(self.control_points)]
-        )
-        if math.isclose(u_clamped, 1.0):
-            u_clamped = 1.0  # Garante que 1.0 é tratado corretamente
-
-        x, y = 0.0, 0.0
-        for i in range(len(self.control_points)):  # Soma de P0 a Pn_idx
-            N_ip = self._cox_de_boor(u_clamped, i, self.degree)
-            x += N_ip * self.control_points[i].x
-            y += N_ip * self.control_points[i].y
-        return x, y
+        x, y = self._evaluate_many(np.array([u], dtype=float))[0]
+        return float(x), float(y)
 
     def get_curve_points(
         self, num_samples_per_span: Optional[int] = None
@@ -237,41 +259,106 @@ class BSplineCurve:
             # ou apenas um valor de nó único, retorna o ponto avaliado em u_min_domain.
             return [self._evaluate(u_min_domain)]
 
+        # Todos os parâmetros são avaliados numa única chamada a _evaluate_many
+        evaluated = self._evaluate_many(
+            self._sample_parameters(
+                unique_relevant_knots, u_min_domain, u_max_domain, num_samples_per_span
+            )
+        ).tolist()
+
         # Adiciona o ponto inicial da curva
-        curve_pts.append(self._evaluate(u_min_domain))
+        curve_pts.append(tuple(evaluated[0]))
+        # Evita pontos duplicados consecutivos (ex.: fim de um span e início do
+        # próximo). O último valor (u_max_domain) garante que o ponto final seja
+        # adicionado mesmo com problemas de amostragem/arredondamento.
+        for x, y in evaluated[1:]:
+            last_x, last_y = curve_pts[-1]
+            if not math.isclose(x, last_x, abs_tol=self.EPSILON) or not math.isclose(
+                y, last_y, abs_tol=self.EPSILON
+            ):
+                curve_pts.append((x, y))
+
+        return curve_pts
 
+    @classmethod
+    def _sample_parameters(
+        cls,
+        unique_relevant_knots: List[float],
+        u_min_domain: float,
+        u_max_domain: float,
+        num_samples_per_span: int,
+    ) -> np.ndarray:
+        """
+        Parâmetros amostrados ao longo da curva: início da curva, amostras de >0 a 1
+        dentro de cada span de comprimento > 0 e, por fim, o final da curva (u_max_domain).
+        """
+        span_fractions = np.arange(1, num_samples_per_span + 1) / num_samples_per_span
+        u_values = [np.array([u_min_domain])]
         for k_idx in range(len(unique_relevant_knots) - 1):
             u_start_span = unique_relevant_knots[k_idx]
             u_end_span = unique_relevant_knots[k_idx + 1]
+            if abs(u_end_span - u_start_span) > cls.EPSILON:
+                u_values.append(u_start_span + span_fractions * (u_end_span - u_start_span))
+        u_values.append(np.array([u_max_domain]))
+        return np.concatenate(u_values)
+
+    @classmethod
+    def basis_weights(
+        cls,
+        num_control_points: int,
+        degree: Optional[int] = None,
+        num_samples_per_span: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Calcula os pesos das funções base N_{i,p}(u) nos parâmetros amostrados.
 
-            # Amostra apenas se o intervalo do nó tiver comprimento > 0
-            if abs(u_end_span - u_start_span) > self.EPSILON:
-                for i in range(
-                    1, num_samples_per_span + 1
-                ):  # Amostra de >0 a 1 dentro do span
-                    t_in_span = float(i) / num_samples_per_span
-                    u_eval = u_start_span + t_in_span * (u_end_span - u_start_span)
-
-                    pt = self._evaluate(u_eval)
-                    # Evita pontos duplicados se o último ponto do span anterior for o mesmo
-                    if not curve_pts or (
-                        not math.isclose(pt[0], curve_pts[-1][0], abs_tol=self.EPSILON)
-                        or not math.isclose(
-                            pt[1], curve_pts[-1][1], abs_tol=self.EPSILON
-                        )
-                    ):
-                        curve_pts.append(pt)
-
-        # Garante que o último ponto (em u_max_domain) seja adicionado se não foi
-        # devido a problemas de amostragem/arredondamento.
-        last_pt_eval = self._evaluate(u_max_domain)
-        if not curve_pts or (
-            not math.isclose(last_pt_eval[0], curve_pts[-1][0], abs_tol=self.EPSILON)
-            or not math.isclose(last_pt_eval[1], curve_pts[-1][1], abs_tol=self.EPSILON)
-        ):
-            curve_pts.append(last_pt_eval)
+        Para o vetor de nós "clamped" uniforme, esses pesos dependem apenas do
+        número de pontos de controle, do grau e da amostragem; a curva é então
+        avaliada para quaisquer pontos de controle com `evaluate_with_weights`.
+        As amostras seguem as de `get_curve_points` (sem a remoção de pontos
+        consecutivos repetidos).
 
-        return curve_pts
+        Args:
+            num_control_points: Número de pontos de controle (>= 2).
+            degree: Grau da curva (padrão é DEFAULT_DEGREE, limitado a num_control_points - 1).
+            num_samples_per_span: Amostras por intervalo de nó (padrão DEFAULT_SAMPLES_PER_KNOT_SPAN).
+
+        Returns:
+            np.ndarray: Matriz (amostras, num_control_points) de pesos.
+
+        Raises:
+            ValueError: Se houver menos de 2 pontos de controle.
+        """
+        if num_control_points < 2:
+            raise ValueError("B-spline requer pelo menos 2 pontos de controle.")
+        p = degree if degree is not None else cls.DEFAULT_DEGREE
+        p = max(1, min(p, num_control_points - 1))
+        if num_samples_per_span is None:
+            num_samples_per_span = cls.DEFAULT_SAMPLES_PER_KNOT_SPAN
+        num_samples_per_span = max(2, num_samples_per_span)
+
+        knots = cls._clamped_uniform_knots(num_control_points, p)
+        unique_relevant_knots = sorted(set(knots[p : num_control_points + 1]))
+        us = cls._sample_parameters(
+            unique_relevant_knots, knots[p], knots[num_control_points], num_samples_per_span
+        )
+        # de Boor é linear nos pontos de controle: avaliar com a identidade
+        # (um "ponto" unitário por controle) fornece diretamente os pesos
+        return _de_boor_numpy(np.eye(num_control_points), knots, p, us)
+
+    @staticmethod
+    def evaluate_with_weights(weights: np.ndarray, control_points: np.ndarray) -> np.ndarray:
+        """
+        Avalia a curva a partir de pesos de `basis_weights`.
+
+        Args:
+            weights: Matriz (amostras, n+1) de pesos.
+            control_points: Array (n+1, 2) float64 com os pontos de controle.
+
+        Returns:
+            np.ndarray: Array (amostras, 2) com os pontos da curva.
+        """
+        return weights @ control_points
 
     def create_graphics_item(self) -> QGraphicsPathItem:
         """
@@ -299,11 +386,8 @@ class BSplineCurve:
         if not curve_display_points:
             return QGraphicsPathItem(path)
 
-        path.moveTo(QPointF(curve_display_points[0][0], curve_display_points[0][1]))
-        for x, y in curve_display_points[1:]:
-            path.lineTo(QPointF(x, y))
-
-        item = QGraphicsPathItem(path)
+        # Monta o caminho em lote em vez de um lineTo por amostra
+        item = QGraphicsPathItem(array_to_qpath(np.array(curve_display_points)))
         pen = QPen(self.color, self.GRAPHICS_WIDTH)
         pen.setJoinStyle(Qt.RoundJoin)
         pen.setCapStyle(Qt.RoundCap)
@@ -21,6 +21,9 @@ class Point:
     - Fornecer métodos para manipulação de coordenadas.
     """
 
+    # Sem __dict__ por instância: polígonos e curvas guardam muitos Points
+    __slots__ = ("x", "y", "color")
+
     GRAPHICS_SIZE = 6.0  # Diâmetro visual do ponto na cena
 
     def __init__(self, x: float, y: float, color: Optional[QColor] = None):
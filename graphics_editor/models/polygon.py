@@ -9,6 +9,8 @@ from PyQt5.QtGui import QPen, QBrush, QPolygonF, QColor, QPainterPath
 from PyQt5.QtWidgets import QGraphicsItem, QGraphicsPolygonItem, QGraphicsPathItem
 from typing import List, Tuple, Optional, Union
 
+import numpy as np
+
 from .point import Point  # Importação explícita
 
 
@@ -111,6 +113,19 @@ class Polygon:
         """Retorna as coordenadas (x,y) de todos os vértices."""
         return [p.get_coords() for p in self.points]
 
+    def get_coords_array(self) -> np.ndarray:
+        """
+        Retorna as coordenadas dos vértices como um array (N, 2) float64.
+
+        Formato aceito diretamente pelos recortadores vetorizados
+        (ver clipping.sutherland_hodgman).
+        """
+        coords = np.empty((len(self.points), 2), dtype=np.float64)
+        for i, p in enumerate(self.points):
+            coords[i, 0] = p.x
+            coords[i, 1] = p.y
+        return coords
+
     def get_center(self) -> Tuple[float, float]:
         """Retorna o centro geométrico (média dos vértices)."""
         if not self.points:  # Defensivo, construtor deve garantir pontos
@@ -0,0 +1,57 @@
+# graphics_editor/resources/__init__.py
+"""
+Pacote de recursos (ícones) do editor gráfico.
+
+Se o módulo `resources_rc` tiver sido gerado a partir de `icons.qrc`
+(`pyrcc5 graphics_editor/resources/icons.qrc -o graphics_editor/resources/resources_rc.py`),
+os ícones são lidos do sistema de recursos do Qt (":/icons/..."), embutidos no
+próprio módulo, sem acessar o sistema de arquivos na inicialização. Caso
+contrário, são lidos do diretório `icons/` deste pacote. Ícones ausentes do
+`resources_rc` (por exemplo, acrescentados depois de gerá-lo) também são
+procurados no diretório `icons/`.
+"""
+
+import os
+
+from PyQt5.QtCore import QFile
+
+_ICONS_DIR = os.path.join(os.path.dirname(__file__), "icons") + os.sep
+
+try:
+    from . import resources_rc  # noqa: F401  (registra os recursos ":/icons/...")
+
+    _HAS_RESOURCES = True
+except ImportError:
+    _HAS_RESOURCES = False
+
+_RESOURCE_PREFIX = ":/icons/"
+# Nomes já avisados como ausentes dos recursos compilados (um aviso por ícone)
+_missing_resources = set()
+
+
+def icon_path(name: str) -> str:
+    """
+    Retorna o caminho (recurso Qt ou arquivo) de um ícone.
+
+    Args:
+        name: Nome do arquivo de ícone (ex.: "select.png").
+
+    Returns:
+        str: Caminho utilizável por QIcon/QFile. Se o ícone não estiver nos
+             recursos compilados, retorna o caminho no diretório `icons/`
+             (que pode não existir; quem chama verifica com QFile.exists).
+    """
+    if _HAS_RESOURCES:
+        resource_path = _RESOURCE_PREFIX + name
+        if QFile.exists(resource_path):
+            return resource_path
+        if name not in _missing_resources:
+            _missing_resources.add(name)
+            print(
+                f"Aviso: Ícone '{name}' não está em resources_rc; "
+                f"usando {_ICONS_DIR}{name}"
+            )
+    return _ICONS_DIR + name
+
+
+__all__ = ["icon_path"]
@@ -2,7 +2,7 @@
 from PyQt5.QtCore import QObject, pyqtSignal, QRectF, Qt
 from PyQt5.QtGui import QColor, QVector3D
 from enum import Enum, auto
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 
 class DrawingMode(Enum):
@@ -36,6 +36,7 @@ class LineClippingAlgorithm(Enum):
 
     COHEN_SUTHERLAND = auto()
     LIANG_BARSKY = auto()
+    HYBRID = auto()  # Outcodes de Cohen-Sutherland + recorte de Liang-Barsky
 
 
 class ProjectionMode(Enum):
@@ -56,6 +57,8 @@ class EditorStateManager(QObject):
     Responsável por:
     - Modo de desenho atual (para 2D).
     - Cor de desenho.
+    - Propriedades dos novos polígonos 2D (aberto/preenchido) e se elas são
+      perguntadas a cada polígono.
     - Estado de modificações não salvas.
     - Caminho do arquivo atual (para 2D).
     - Algoritmo de recorte de linha 2D.
@@ -70,6 +73,8 @@ class EditorStateManager(QObject):
     filepath_changed = pyqtSignal(str)
     line_clipper_changed = pyqtSignal(LineClippingAlgorithm)
     clip_rect_changed = pyqtSignal(QRectF)  # Para viewport 2D
+    polygon_defaults_changed = pyqtSignal(bool, bool)  # (is_open, is_filled)
+    polygon_prompt_changed = pyqtSignal(bool)
 
     # Sinais para 3D
     camera_params_changed = pyqtSignal()  # Emitido quando VRP, target, ou VUP mudam
@@ -104,10 +109,15 @@ class EditorStateManager(QObject):
         super().__init__(parent)
         self._drawing_mode: DrawingMode = DrawingMode.SELECT
         self._current_draw_color: QColor = QColor(Qt.black)
+        # Propriedades aplicadas aos novos polígonos (editáveis na barra de ferramentas)
+        self._polygon_is_open: bool = False
+        self._polygon_is_filled: bool = False
+        # Se True, pergunta tipo/preenchimento a cada polígono (opcional)
+        self._polygon_prompt_enabled: bool = False
         self._unsaved_changes: bool = False
         self._current_filepath: Optional[str] = None
         self._selected_line_clipper: LineClippingAlgorithm = (
-            LineClippingAlgorithm.COHEN_SUTHERLAND
+            LineClippingAlgorithm.HYBRID
         )
         self._clip_rect: QRectF = self.DEFAULT_CLIP_RECT.normalized()  # Para 2D
 
@@ -145,6 +155,24 @@ class EditorStateManager(QObject):
         """
         return self._current_draw_color
 
+    def polygon_defaults(self) -> Tuple[bool, bool]:
+        """
+        Retorna as propriedades aplicadas aos novos polígonos.
+
+        Returns:
+            Tuple[bool, bool]: (is_open, is_filled)
+        """
+        return self._polygon_is_open, self._polygon_is_filled
+
+    def polygon_prompt_enabled(self) -> bool:
+        """
+        Verifica se o tipo/preenchimento deve ser perguntado a cada polígono.
+
+        Returns:
+            bool: True se a consulta por diálogo estiver ativada
+        """
+        return self._polygon_prompt_enabled
+
     def has_unsaved_changes(self) -> bool:
         """
         Verifica se há modificações não salvas.
@@ -234,6 +262,33 @@ class EditorStateManager(QObject):
             self._current_draw_color = color
             self.draw_color_changed.emit(color)
 
+    def set_polygon_defaults(self, is_open: bool, is_filled: bool):
+        """
+        Define as propriedades aplicadas aos novos polígonos.
+
+        Args:
+            is_open: True para polilinha aberta
+            is_filled: True para polígono fechado preenchido (ignorado se aberto)
+        """
+        is_open = bool(is_open)
+        is_filled = bool(is_filled) and not is_open
+        if (self._polygon_is_open, self._polygon_is_filled) != (is_open, is_filled):
+            self._polygon_is_open = is_open
+            self._polygon_is_filled = is_filled
+            self.polygon_defaults_changed.emit(is_open, is_filled)
+
+    def set_polygon_prompt_enabled(self, enabled: bool):
+        """
+        Ativa ou desativa a consulta por diálogo a cada novo polígono.
+
+        Args:
+            enabled: True para perguntar tipo/preenchimento a cada polígono
+        """
+        enabled = bool(enabled)
+        if self._polygon_prompt_enabled != enabled:
+            self._polygon_prompt_enabled = enabled
+            self.polygon_prompt_changed.emit(enabled)
+
     def set_unsaved_changes(self, changed: bool):
         """
         Define o estado de modificações não salvas.
@@ -1,5 +1,4 @@
 # graphics_editor/ui_manager.py
-import os
 from PyQt5.QtCore import (
     QSize,
     Qt,
@@ -7,6 +6,7 @@ from PyQt5.QtCore import (
     QRectF,
     QPointF,
     QSignalBlocker,
+    QFile,
 )  # Import QSignalBlocker
 from PyQt5.QtWidgets import (
     QMainWindow,
@@ -16,6 +16,7 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QVBoxLayout,
     QRadioButton,
+    QCheckBox,
     QWidgetAction,
     QLabel,
     QStatusBar,
@@ -29,6 +30,7 @@ from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QPen
 from typing import Callable, Dict, Any, Optional
 
 from .state_manager import DrawingMode, LineClippingAlgorithm
+from .resources import icon_path
 
 
 class UIManager:
@@ -54,15 +56,17 @@ class UIManager:
         """
         self.window = main_window
         self.state_manager = state_manager
-        self._icon_base_path = os.path.join(
-            os.path.dirname(__file__), "resources", "icons"
-        )
+        self._icon_cache: Dict[str, QIcon] = {}
 
         self.toolbar: Optional[QToolBar] = None
         self.mode_action_group: Optional[QActionGroup] = None
         self.color_action: Optional[QAction] = None
         self.cs_radio: Optional[QRadioButton] = None  # Para clipping 2D
         self.lb_radio: Optional[QRadioButton] = None  # Para clipping 2D
+        self.hybrid_radio: Optional[QRadioButton] = None  # Para clipping 2D
+        self.polygon_open_check: Optional[QCheckBox] = None  # Novos polígonos 2D
+        self.polygon_filled_check: Optional[QCheckBox] = None  # Novos polígonos 2D
+        self.polygon_prompt_check: Optional[QCheckBox] = None  # Novos polígonos 2D
 
         self.status_bar: Optional[QStatusBar] = None
         self.status_message_label: Optional[QLabel] = None
@@ -76,7 +80,7 @@ class UIManager:
 
     def _get_icon(self, name: str) -> QIcon:
         """
-        Obtém um ícone do diretório de recursos.
+        Obtém um ícone dos recursos (ver graphics_editor/resources).
 
         Args:
             name: Nome do arquivo de ícone
@@ -84,8 +88,13 @@ class UIManager:
         Returns:
             QIcon: Ícone carregado ou um ícone de fallback se não encontrado
         """
-        path = os.path.join(self._icon_base_path, name)
-        if not os.path.exists(path):
+        icon = self._icon_cache.get(name)
+        if icon is not None:
+            return icon
+        path = icon_path(name)
+        if QFile.exists(path):
+            icon = QIcon(path)
+        else:
             # Cria um ícone de fallback simples
             pixmap = QPixmap(24, 24)
             pixmap.fill(Qt.transparent)
@@ -94,8 +103,9 @@ class UIManager:
             painter.drawRect(0, 0, 23, 23)
             painter.drawText(QRectF(0, 0, 24, 24), Qt.AlignCenter, "?")
             painter.end()
-            return QIcon(pixmap)
-        return QIcon(path)
+            icon = QIcon(pixmap)
+        self._icon_cache[name] = icon
+        return icon
 
     def _create_color_icon(self, color: QColor, size: int = 16) -> QIcon:
         """
@@ -217,6 +227,8 @@ class UIManager:
         coord_callback: Callable[[], None],  # Para entrada de coords 2D
         transform_callback: Callable[[], None],  # Genérico
         clipper_callback: Callable[[LineClippingAlgorithm], None],  # Para clipping 2D
+        polygon_callback: Callable[[bool, bool], None],  # (is_open, is_filled)
+        polygon_prompt_callback: Callable[[bool], None],
     ) -> QToolBar:
         """
         Configura a barra de ferramentas da aplicação.
@@ -227,6 +239,8 @@ class UIManager:
             coord_callback: Callback para entrada de coordenadas 2D.
             transform_callback: Callback para transformações (2D e 3D).
             clipper_callback: Callback para seleção de algoritmo de recorte de linha 2D.
+            polygon_callback: Callback para as propriedades dos novos polígonos 2D.
+            polygon_prompt_callback: Callback para ativar a pergunta a cada polígono.
 
         Returns:
             QToolBar: Barra de ferramentas configurada.
@@ -335,11 +349,16 @@ class UIManager:
         clipping_layout.setSpacing(2)
         self.cs_radio = QRadioButton("Cohen-Suth.")
         self.lb_radio = QRadioButton("Liang-Barsky")
+        self.hybrid_radio = QRadioButton("Híbrido (CS+LB)")
+        self.hybrid_radio.setToolTip(
+            "Outcodes de Cohen-Sutherland para os casos triviais, Liang-Barsky para o recorte"
+        )
         initial_clipper = self.state_manager.selected_line_clipper()
         self.cs_radio.setChecked(
             initial_clipper == LineClippingAlgorithm.COHEN_SUTHERLAND
         )
         self.lb_radio.setChecked(initial_clipper == LineClippingAlgorithm.LIANG_BARSKY)
+        self.hybrid_radio.setChecked(initial_clipper == LineClippingAlgorithm.HYBRID)
         self.cs_radio.toggled.connect(
             lambda checked: (
                 clipper_callback(LineClippingAlgorithm.COHEN_SUTHERLAND)
@@ -354,12 +373,53 @@ class UIManager:
                 else None
             )
         )
+        self.hybrid_radio.toggled.connect(
+            lambda checked: (
+                clipper_callback(LineClippingAlgorithm.HYBRID) if checked else None
+            )
+        )
         clipping_layout.addWidget(self.cs_radio)
         clipping_layout.addWidget(self.lb_radio)
+        clipping_layout.addWidget(self.hybrid_radio)
         clipping_group_box.setLayout(clipping_layout)
         clipping_action = QWidgetAction(self.window)
         clipping_action.setDefaultWidget(clipping_group_box)
         toolbar.addAction(clipping_action)
+
+        # Propriedades dos novos polígonos (2D), aplicadas sem diálogo
+        polygon_group_box = QGroupBox("Polígono (2D)")
+        polygon_layout = QVBoxLayout()
+        polygon_layout.setContentsMargins(2, 2, 2, 2)
+        polygon_layout.setSpacing(2)
+        self.polygon_open_check = QCheckBox("Aberto (polilinha)")
+        self.polygon_filled_check = QCheckBox("Preenchido")
+        self.polygon_prompt_check = QCheckBox("Perguntar sempre")
+        self.polygon_prompt_check.setToolTip(
+            "Pergunta o tipo e o preenchimento ao iniciar cada polígono"
+        )
+        initial_open, initial_filled = self.state_manager.polygon_defaults()
+        self.update_polygon_defaults_selection(initial_open, initial_filled)
+        self.update_polygon_prompt_selection(
+            self.state_manager.polygon_prompt_enabled()
+        )
+        self.polygon_open_check.toggled.connect(
+            lambda checked: polygon_callback(
+                checked, self.polygon_filled_check.isChecked()
+            )
+        )
+        self.polygon_filled_check.toggled.connect(
+            lambda checked: polygon_callback(
+                self.polygon_open_check.isChecked(), checked
+            )
+        )
+        self.polygon_prompt_check.toggled.connect(polygon_prompt_callback)
+        polygon_layout.addWidget(self.polygon_open_check)
+        polygon_layout.addWidget(self.polygon_filled_check)
+        polygon_layout.addWidget(self.polygon_prompt_check)
+        polygon_group_box.setLayout(polygon_layout)
+        polygon_action = QWidgetAction(self.window)
+        polygon_action.setDefaultWidget(polygon_group_box)
+        toolbar.addAction(polygon_action)
         return toolbar
 
     def setup_status_bar(self, zoom_callback: Callable[[int], None]) -> QStatusBar:
@@ -450,12 +510,31 @@ class UIManager:
         self, algorithm: LineClippingAlgorithm
     ):  # Para clipping 2D
         """Atualiza a seleção do algoritmo de recorte."""
-        if self.cs_radio and self.lb_radio:
-            is_cs = algorithm == LineClippingAlgorithm.COHEN_SUTHERLAND
-            if self.cs_radio.isChecked() != is_cs:
-                self.cs_radio.setChecked(is_cs)
-            if self.lb_radio.isChecked() == is_cs:
-                self.lb_radio.setChecked(not is_cs)
+        radios = {
+            LineClippingAlgorithm.COHEN_SUTHERLAND: self.cs_radio,
+            LineClippingAlgorithm.LIANG_BARSKY: self.lb_radio,
+            LineClippingAlgorithm.HYBRID: self.hybrid_radio,
+        }
+        radio = radios.get(algorithm)
+        if radio and not radio.isChecked():
+            radio.setChecked(True)  # Botões exclusivos: desmarca os demais
+
+    def update_polygon_defaults_selection(self, is_open: bool, is_filled: bool):
+        """Atualiza as opções de polígono (2D) na barra de ferramentas."""
+        if self.polygon_open_check and self.polygon_filled_check:
+            with QSignalBlocker(self.polygon_open_check), QSignalBlocker(
+                self.polygon_filled_check
+            ):
+                self.polygon_open_check.setChecked(is_open)
+                self.polygon_filled_check.setChecked(is_filled)
+            # Polilinhas abertas nunca são preenchidas
+            self.polygon_filled_check.setEnabled(not is_open)
+
+    def update_polygon_prompt_selection(self, enabled: bool):
+        """Atualiza a opção de perguntar as propriedades a cada polígono."""
+        if self.polygon_prompt_check:
+            with QSignalBlocker(self.polygon_prompt_check):
+                self.polygon_prompt_check.setChecked(enabled)
 
     def update_status_bar_message(self, message: str):
         """Atualiza a mensagem na barra de status."""
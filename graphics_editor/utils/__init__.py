@@ -6,14 +6,23 @@ Contém módulos para:
 - clipping: Algoritmos de recorte 2D (Cohen-Sutherland, Liang-Barsky, Sutherland-Hodgman).
 - transformations: Funções para transformações geométricas 2D usando matrizes homogêneas.
 - transformations_3d: Funções para transformações geométricas 3D e projeção.
+- spatial_index: Índice espacial em grade para caixas delimitadoras 2D.
+- qpath: Construção em lote de QPainterPath a partir de arrays NumPy.
+- simplify: Simplificação de polilinhas (Ramer-Douglas-Peucker).
 """
 
 from . import clipping
 from . import transformations
 from . import transformations_3d  # Novo
+from . import spatial_index
+from . import qpath
+from . import simplify
 
 __all__ = [
     "clipping",
     "transformations",
     "transformations_3d",
+    "spatial_index",
+    "qpath",
+    "simplify",
 ]
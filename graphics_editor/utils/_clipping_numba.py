@@ -0,0 +1,170 @@
+"""
+Kernels de recorte compilados com Numba (opcional).
+
+Este módulo só é importado por `clipping.py` quando o Numba está instalado;
+caso contrário a importação falha com ImportError e a implementação em
+Python puro é usada.
+"""
+
+# graphics_editor/utils/_clipping_numba.py
+import numpy as np
+from numba import njit, prange
+
+EPSILON = 1e-9
+
+
+@njit(cache=True)
+def _sh_clip_edge(src, src_len, dst, axis, bound, is_min):
+    """
+    Recorta os `src_len` primeiros vértices de `src` contra uma única borda,
+    escrevendo o resultado em `dst`.
+
+    Returns:
+        int: Número de vértices escritos em `dst`, ou -1 se `dst` não tiver
+             capacidade suficiente.
+    """
+    if src_len == 0:
+        return 0
+    capacity = dst.shape[0]
+    other = 1 - axis
+    out_len = 0
+
+    s_axis = src[src_len - 1, axis]
+    s_other = src[src_len - 1, other]
+    s_is_inside = s_axis >= bound if is_min else s_axis <= bound
+    for i in range(src_len):
+        e_axis = src[i, axis]
+        e_other = src[i, other]
+        e_is_inside = e_axis >= bound if is_min else e_axis <= bound
+
+        if s_is_inside != e_is_inside:  # Aresta cruza a borda -> interseção
+            if out_len >= capacity:
+                return -1
+            # Lados opostos da borda: e_axis != s_axis, divisão sempre segura
+            t = (bound - s_axis) / (e_axis - s_axis)
+            cross = s_other + (e_other - s_other) * t
+            dst[out_len, axis] = bound
+            dst[out_len, other] = cross
+            out_len += 1
+        if e_is_inside:
+            if out_len >= capacity:
+                return -1
+            dst[out_len, 0] = src[i, 0]
+            dst[out_len, 1] = src[i, 1]
+            out_len += 1
+
+        s_axis = e_axis
+        s_other = e_other
+        s_is_inside = e_is_inside
+    return out_len
+
+
+@njit(cache=True)
+def sh_kernel(verts, xmin, ymin, xmax, ymax, out_a, out_b):
+    """
+    Sutherland-Hodgman sobre arrays contíguos float64 de forma (n, 2).
+
+    As 4 bordas alternam entre `out_a` e `out_b` (verts -> a -> b -> a -> b),
+    portanto o polígono final fica sempre em `out_b`.
+
+    Returns:
+        int: Número de vértices do polígono recortado em `out_b`, ou -1 se os
+             buffers não tiverem capacidade suficiente.
+    """
+    n = _sh_clip_edge(verts, verts.shape[0], out_a, 0, xmin, True)
+    if n <= 0:
+        return n
+    n = _sh_clip_edge(out_a, n, out_b, 0, xmax, False)
+    if n <= 0:
+        return n
+    n = _sh_clip_edge(out_b, n, out_a, 1, ymin, True)
+    if n <= 0:
+        return n
+    return _sh_clip_edge(out_a, n, out_b, 1, ymax, False)
+
+
+@njit(parallel=True, cache=True)
+def clip_segments_kernel(segments, xmin, ymin, xmax, ymax, out, visible):
+    """
+    Recorta em paralelo um lote de segmentos (N, 4) = (x1, y1, x2, y2).
+
+    Cada segmento é classificado pelos outcodes de Cohen-Sutherland (casos
+    triviais) e, se cruzar a janela, recortado por Liang-Barsky. As iterações
+    escrevem em posições independentes de `out`/`visible`, sem travas.
+    """
+    for i in prange(segments.shape[0]):
+        x1 = segments[i, 0]
+        y1 = segments[i, 1]
+        x2 = segments[i, 2]
+        y2 = segments[i, 3]
+        out[i, 0] = x1
+        out[i, 1] = y1
+        out[i, 2] = x2
+        out[i, 3] = y2
+        inside1 = xmin <= x1 <= xmax and ymin <= y1 <= ymax
+        inside2 = xmin <= x2 <= xmax and ymin <= y2 <= ymax
+        if inside1 and inside2:  # Aceitação trivial
+            visible[i] = True
+            continue
+        if (
+            (x1 < xmin and x2 < xmin)
+            or (x1 > xmax and x2 > xmax)
+            or (y1 < ymin and y2 < ymin)
+            or (y1 > ymax and y2 > ymax)
+        ):  # Rejeição trivial
+            visible[i] = False
+            continue
+
+        dx = x2 - x1
+        dy = y2 - y1
+        u1 = 0.0
+        u2 = 1.0
+        ok = True
+        for k in range(4):
+            if k == 0:
+                p = -dx
+                q = x1 - xmin
+            elif k == 1:
+                p = dx
+                q = xmax - x1
+            elif k == 2:
+                p = -dy
+                q = y1 - ymin
+            else:
+                p = dy
+                q = ymax - y1
+            if abs(p) < EPSILON:
+                if q < 0:
+                    ok = False
+                    break
+            else:
+                r = q / p
+                if p < 0:
+                    if r > u1:
+                        u1 = r
+                elif r < u2:
+                    u2 = r
+            if u1 > u2:
+                ok = False
+                break
+        visible[i] = ok
+        if ok:
+            out[i, 0] = x1 + u1 * dx
+            out[i, 1] = y1 + u1 * dy
+            out[i, 2] = x1 + u2 * dx
+            out[i, 3] = y1 + u2 * dy
+
+
+def _warm_up():
+    """Força a compilação (ou carga do cache) dos kernels na importação."""
+    verts = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0]], dtype=np.float64)
+    out_a = np.empty((14, 2), dtype=np.float64)
+    out_b = np.empty((14, 2), dtype=np.float64)
+    sh_kernel(verts, 0.5, 0.5, 1.5, 1.5, out_a, out_b)
+    segments = np.array([[0.0, 0.0, 2.0, 2.0]], dtype=np.float64)
+    clip_segments_kernel(
+        segments, 0.5, 0.5, 1.5, 1.5, np.empty_like(segments), np.empty(1, dtype=np.bool_)
+    )
+
+
+_warm_up()
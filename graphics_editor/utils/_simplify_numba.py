@@ -0,0 +1,78 @@
+"""
+Kernel de simplificação de polilinhas compilado com Numba (opcional).
+
+Este módulo só é importado por `simplify.py` quando o Numba está instalado;
+caso contrário a importação falha com ImportError e a implementação
+vetorizada com NumPy é usada.
+"""
+
+# graphics_editor/utils/_simplify_numba.py
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def rdp_mask_kernel(xy, tolerance, keep):
+    """
+    Marca em `keep` os vértices mantidos pelo Ramer-Douglas-Peucker iterativo.
+
+    Args:
+        xy: Array (N, 2) float64 contíguo com os vértices (N >= 2).
+        tolerance: Distância máxima de um vértice removido ao segmento que o substitui.
+        keep: Array (N,) booleano, todo False na entrada.
+    """
+    n = xy.shape[0]
+    keep[0] = True
+    keep[n - 1] = True
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+    tol_sq = tolerance * tolerance
+    while top > 0:
+        top -= 1
+        start = stack[top, 0]
+        end = stack[top, 1]
+        if end - start < 2:
+            continue
+        ax = xy[start, 0]
+        ay = xy[start, 1]
+        dx = xy[end, 0] - ax
+        dy = xy[end, 1] - ay
+        seg_len_sq = dx * dx + dy * dy
+        max_dist_sq = -1.0
+        index = start
+        for i in range(start + 1, end):
+            px = xy[i, 0] - ax
+            py = xy[i, 1] - ay
+            if seg_len_sq == 0.0:  # Extremos coincidentes: distância ao ponto
+                dist_sq = px * px + py * py
+            else:
+                # Distância ao segmento: projeção limitada a [0, 1]
+                t = (px * dx + py * dy) / seg_len_sq
+                if t < 0.0:
+                    t = 0.0
+                elif t > 1.0:
+                    t = 1.0
+                ex = px - t * dx
+                ey = py - t * dy
+                dist_sq = ex * ex + ey * ey
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                index = i
+        if max_dist_sq > tol_sq:
+            keep[index] = True
+            stack[top, 0] = start
+            stack[top, 1] = index
+            stack[top + 1, 0] = index
+            stack[top + 1, 1] = end
+            top += 2
+
+
+def _warm_up():
+    """Força a compilação (ou carga do cache) do kernel na importação."""
+    xy = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]], dtype=np.float64)
+    rdp_mask_kernel(xy, 0.5, np.zeros(3, dtype=np.bool_))
+
+
+_warm_up()
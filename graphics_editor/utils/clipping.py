@@ -4,6 +4,7 @@ Módulo que implementa algoritmos de recorte (clipping) para gráficos 2D.
 Este módulo contém implementações de algoritmos clássicos de recorte:
 - Cohen-Sutherland: Para recorte de segmentos de linha
 - Liang-Barsky: Para recorte de segmentos de linha (alternativa)
+- Híbrido (Cohen-Sutherland + Liang-Barsky): classifica com outcodes e recorta com Liang-Barsky
 - Sutherland-Hodgman: Para recorte de polígonos
 
 Os algoritmos suportam recorte contra um retângulo arbitrário.
@@ -11,11 +12,45 @@ Os algoritmos suportam recorte contra um retângulo arbitrário.
 
 # graphics_editor/utils/clipping.py
 import math
-from typing import List, Tuple, Optional, Union
+from typing import List, Tuple, Optional, Union, Callable
 from enum import Enum
 
+import numpy as np
 from PyQt5.QtCore import QRectF
 
+# Kernel Numba opcional para Sutherland-Hodgman em polígonos grandes.
+# O módulo compila os kernels já na importação (_warm_up); qualquer falha
+# nessa etapa (não só a ausência do Numba) recai nas versões em Python.
+try:
+    from ._clipping_numba import (
+        clip_segments_kernel as _clip_segments_kernel,
+        sh_kernel as _sh_kernel,
+    )
+except Exception:
+    _clip_segments_kernel = None
+    _sh_kernel = None
+
+# Versão compilada opcional (Cython) dos algoritmos de recorte, gerada com
+# `python setup.py build_ext --inplace`. Os nomes são privados: as funções
+# públicas deste módulo continuam sendo os pontos de entrada e só delegam o
+# trabalho às rotinas compiladas (no caso de Sutherland-Hodgman, depois dos
+# testes triviais, do quickclip e do kernel Numba).
+try:
+    from ._clipping import (
+        cohen_sutherland as _c_cohen_sutherland,
+        hybrid_clip as _c_hybrid_clip,
+        liang_barsky as _c_liang_barsky,
+        sutherland_hodgman as _c_sutherland_hodgman,
+    )
+
+    _HAS_COMPILED_CLIPPERS = True
+except ImportError:
+    _c_cohen_sutherland = None
+    _c_hybrid_clip = None
+    _c_liang_barsky = None
+    _c_sutherland_hodgman = None
+    _HAS_COMPILED_CLIPPERS = False
+
 Point2D = Tuple[float, float]
 
 # (xmin, ymin, xmax, ymax) - QRectF usa (left, top, width, height)
@@ -24,6 +59,19 @@ ClipRect = Tuple[float, float, float, float]
 
 EPSILON = 1e-9  # Pequena tolerância para comparações de ponto flutuante
 
+# Recortador de linha especializado para um retângulo fixo: (p1, p2) -> segmento ou None
+LineClipper = Callable[[Point2D, Point2D], Optional[Tuple[Point2D, Point2D]]]
+
+# A partir deste número de segmentos, clip_segments usa o kernel Numba paralelo
+# (se disponível); lotes menores não compensam o custo de despacho das threads.
+CLIP_SEGMENTS_NUMBA_MIN = 512
+# A partir deste número de vértices, Sutherland-Hodgman usa o kernel Numba
+# (se disponível); abaixo disso a conversão para ndarray não compensa.
+SH_NUMBA_MIN_VERTICES = 64
+# A partir deste número de vértices, Sutherland-Hodgman roda antes o pré-passo
+# "quickclip" que descarta vértices redundantes fora do retângulo.
+SH_QUICKCLIP_MIN_VERTICES = 16
+
 
 def qrectf_to_cliprect(qrect: QRectF) -> ClipRect:
     """Converte um QRectF para o formato de tupla (xmin, ymin, xmax, ymax), garantindo normalização."""
@@ -55,6 +103,23 @@ def clip_point(point: Point2D, clip_rect_tuple: ClipRect) -> Optional[Point2D]:
     return None
 
 
+def clip_points(points: np.ndarray, clip_rect_tuple: ClipRect) -> np.ndarray:
+    """
+    Versão vetorizada de clip_point para vários pontos de uma vez.
+
+    Args:
+        points: Array (N, 2) de coordenadas (x, y).
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        np.ndarray: Máscara booleana (N,) com True para os pontos dentro do retângulo.
+    """
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    xs = points[:, 0]
+    ys = points[:, 1]
+    return (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+
+
 # Códigos de região para Cohen-Sutherland
 INSIDE = 0b0000  # 0
 LEFT = 0b0001  # 1
@@ -79,16 +144,9 @@ def _compute_cohen_sutherland_code(
     """
     xmin, ymin, xmax, ymax = clip_rect_tuple  # Assume xmin <= xmax, ymin <= ymax
 
-    code = INSIDE
-    if x < xmin:
-        code |= LEFT
-    elif x > xmax:
-        code |= RIGHT
-    if y < ymin:
-        code |= BOTTOM  # y < ymin (acima de ymin, pois y cresce para baixo)
-    elif y > ymax:
-        code |= TOP  # y > ymax (abaixo de ymax)
-    return code
+    # Sem desvios: cada comparação (bool, subclasse de int) vira um bit do código.
+    # LEFT=1, RIGHT=2, BOTTOM=4 (y < ymin), TOP=8 (y > ymax)
+    return (x < xmin) | ((x > xmax) << 1) | ((y < ymin) << 2) | ((y > ymax) << 3)
 
 
 def cohen_sutherland(
@@ -106,12 +164,15 @@ def cohen_sutherland(
         Optional[Tuple[Point2D, Point2D]]: O segmento recortado (pode ser o original,
                                             um subsegmento, ou None se totalmente fora).
     """
+    if _c_cohen_sutherland is not None:
+        return _c_cohen_sutherland(p1, p2, clip_rect_tuple)
     x1, y1 = p1
     x2, y2 = p2
     xmin, ymin, xmax, ymax = clip_rect_tuple  # Assumido normalizado
 
-    code1 = _compute_cohen_sutherland_code(x1, y1, clip_rect_tuple)
-    code2 = _compute_cohen_sutherland_code(x2, y2, clip_rect_tuple)
+    # Outcodes calculados em linha (ver _compute_cohen_sutherland_code)
+    code1 = (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+    code2 = (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
 
     while True:
         if not (code1 | code2):  # Aceitação trivial: ambos os pontos dentro
@@ -160,10 +221,14 @@ def cohen_sutherland(
             # Atualiza o ponto que estava fora com o ponto de interseção
             if code_out == code1:
                 x1, y1 = x, y
-                code1 = _compute_cohen_sutherland_code(x1, y1, clip_rect_tuple)
+                code1 = (
+                    (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+                )
             else:
                 x2, y2 = x, y
-                code2 = _compute_cohen_sutherland_code(x2, y2, clip_rect_tuple)
+                code2 = (
+                    (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
+                )
 
 
 def liang_barsky(
@@ -180,6 +245,8 @@ def liang_barsky(
     Returns:
         Optional[Tuple[Point2D, Point2D]]: O segmento recortado ou None.
     """
+    if _c_liang_barsky is not None:
+        return _c_liang_barsky(p1, p2, clip_rect_tuple)
     x1, y1 = p1
     x2, y2 = p2
     xmin, ymin, xmax, ymax = clip_rect_tuple  # Assumido normalizado
@@ -219,130 +286,480 @@ def liang_barsky(
     return ((clipped_x1, clipped_y1), (clipped_x2, clipped_y2))
 
 
-def _intersect_polygon_edge(
-    p1: Point2D, p2: Point2D, edge_index: int, clip_rect_tuple: ClipRect
-) -> Point2D:
+def hybrid_clip(
+    p1: Point2D, p2: Point2D, clip_rect_tuple: ClipRect
+) -> Optional[Tuple[Point2D, Point2D]]:
     """
-    Calcula a interseção de um segmento de polígono [p1, p2] com uma das bordas do retângulo de recorte.
-    Usado por Sutherland-Hodgman.
+    Recorta um segmento de linha [p1, p2] combinando Cohen-Sutherland e Liang-Barsky.
+
+    Os outcodes de Cohen-Sutherland resolvem os casos triviais (aceitação e
+    rejeição); só os segmentos que realmente cruzam a janela passam por
+    Liang-Barsky, que recorta sem as iterações de Cohen-Sutherland.
 
     Args:
-        p1, p2: Pontos do segmento da aresta do polígono.
-        edge_index: Índice da borda do retângulo (0=esquerda, 1=direita, 2=inferior(ymin), 3=superior(ymax)).
+        p1: Ponto inicial (x1, y1) do segmento.
+        p2: Ponto final (x2, y2) do segmento.
         clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
 
     Returns:
-        Point2D: Ponto de interseção.
+        Optional[Tuple[Point2D, Point2D]]: O segmento recortado ou None.
     """
-    xmin, ymin, xmax, ymax = clip_rect_tuple
+    if _c_hybrid_clip is not None:
+        return _c_hybrid_clip(p1, p2, clip_rect_tuple)
     x1, y1 = p1
     x2, y2 = p2
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+
+    code1 = (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+    code2 = (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
+    if not (code1 | code2):  # Aceitação trivial
+        return ((x1, y1), (x2, y2))
+    if code1 & code2:  # Rejeição trivial
+        return None
+    return liang_barsky(p1, p2, clip_rect_tuple)
+
+
+def clip_segments(
+    segments: np.ndarray, clip_rect_tuple: ClipRect
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recorta um lote de segmentos de uma vez (mesma semântica de hybrid_clip).
+
+    Com Numba, lotes grandes são recortados em paralelo (um segmento por
+    iteração de `prange`); caso contrário, Liang-Barsky é avaliado de forma
+    vetorizada com NumPy sobre todos os segmentos.
+
+    Args:
+        segments: Array (N, 4) float64 com (x1, y1, x2, y2) de cada segmento.
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Segmentos recortados (N, 4) e máscara
+                                       booleana (N,) dos segmentos visíveis.
+                                       Linhas não visíveis têm valores indefinidos.
+    """
+    segments = np.ascontiguousarray(segments, dtype=np.float64).reshape(-1, 4)
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    if _clip_segments_kernel is not None and len(segments) >= CLIP_SEGMENTS_NUMBA_MIN:
+        clipped = np.empty_like(segments)
+        visible = np.empty(len(segments), dtype=np.bool_)
+        _clip_segments_kernel(segments, xmin, ymin, xmax, ymax, clipped, visible)
+        return clipped, visible
+
+    x1, y1, x2, y2 = segments.T
     dx = x2 - x1
     dy = y2 - y1
-    intersect_x, intersect_y = 0.0, 0.0
+    # Parâmetros (p, q) de Liang-Barsky para as 4 bordas, um por coluna
+    p = np.stack((-dx, dx, -dy, dy), axis=1)
+    q = np.stack((x1 - xmin, xmax - x1, y1 - ymin, ymax - y1), axis=1)
+    parallel = np.abs(p) < EPSILON
+    r = q / np.where(parallel, 1.0, p)
+    u1 = np.where(~parallel & (p < 0), r, 0.0).max(axis=1)
+    u2 = np.where(~parallel & (p > 0), r, 1.0).min(axis=1)
+    visible = (u1 <= u2) & ~(parallel & (q < 0)).any(axis=1)
+
+    clipped = np.stack((x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy), axis=1)
+    # Aceitação trivial: mantém os extremos originais, como hybrid_clip
+    inside = (q >= 0).all(axis=1) & (x2 >= xmin) & (x2 <= xmax) & (y2 >= ymin) & (y2 <= ymax)
+    clipped[inside] = segments[inside]
+    return clipped, visible
 
-    if edge_index == 0:  # Borda Esquerda (x = xmin)
-        intersect_x = xmin
-        intersect_y = y1 + dy * (xmin - x1) / dx if abs(dx) > EPSILON else y1
-    elif edge_index == 1:  # Borda Direita (x = xmax)
-        intersect_x = xmax
-        intersect_y = y1 + dy * (xmax - x1) / dx if abs(dx) > EPSILON else y1
-    elif edge_index == 2:  # Borda Inferior (y = ymin, "de cima" nas coords de tela)
-        intersect_y = ymin
-        intersect_x = x1 + dx * (ymin - y1) / dy if abs(dy) > EPSILON else x1
-    elif edge_index == 3:  # Borda Superior (y = ymax, "de baixo" nas coords de tela)
-        intersect_y = ymax
-        intersect_x = x1 + dx * (ymax - y1) / dy if abs(dy) > EPSILON else x1
 
-    return intersect_x, intersect_y
+# --- Recortadores especializados para um retângulo fixo ---
+# O retângulo de recorte é o mesmo para todos os objetos de um redesenho; as
+# fábricas abaixo capturam seus limites uma vez, evitando desempacotá-los a
+# cada segmento.
 
 
-def _is_inside_edge(p: Point2D, edge_index: int, clip_rect_tuple: ClipRect) -> bool:
+def make_cohen_sutherland(clip_rect_tuple: ClipRect) -> LineClipper:
     """
-    Verifica se um ponto 'p' está do lado "interno" de uma borda específica do retângulo de recorte.
-    Usado por Sutherland-Hodgman.
+    Cria um recortador Cohen-Sutherland com o retângulo de recorte fixado.
 
     Args:
-        p: Ponto (x,y) a ser verificado.
-        edge_index: Índice da borda (0=esquerda, 1=direita, 2=inferior(ymin), 3=superior(ymax)).
         clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
 
     Returns:
-        bool: True se o ponto está do lado interno da borda, False caso contrário.
+        LineClipper: Função (p1, p2) equivalente a cohen_sutherland(p1, p2, clip_rect_tuple).
     """
+    if _HAS_COMPILED_CLIPPERS:
+        return lambda p1, p2: _c_cohen_sutherland(p1, p2, clip_rect_tuple)
+
     xmin, ymin, xmax, ymax = clip_rect_tuple
-    x, y = p
 
-    if edge_index == 0:
-        return x >= xmin  # Para borda esquerda, "dentro" é x >= xmin
-    if edge_index == 1:
-        return x <= xmax  # Para borda direita, "dentro" é x <= xmax
-    if edge_index == 2:
-        return (
-            y >= ymin
-        )  # Para borda inferior (ymin), "dentro" é y >= ymin (lembre-se que y cresce para baixo)
-    if edge_index == 3:
-        return y <= ymax  # Para borda superior (ymax), "dentro" é y <= ymax
-    return False  # Índice de borda inválido
+    def clip(p1: Point2D, p2: Point2D) -> Optional[Tuple[Point2D, Point2D]]:
+        x1, y1 = p1
+        x2, y2 = p2
+        code1 = (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+        code2 = (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
+        while True:
+            if not (code1 | code2):
+                return ((x1, y1), (x2, y2))
+            if code1 & code2:
+                return None
+            code_out = code1 if code1 else code2
+            if code_out & TOP:
+                x = x1 + (x2 - x1) * (ymax - y1) / (y2 - y1) if abs(y2 - y1) > EPSILON else x1
+                y = ymax
+            elif code_out & BOTTOM:
+                x = x1 + (x2 - x1) * (ymin - y1) / (y2 - y1) if abs(y2 - y1) > EPSILON else x1
+                y = ymin
+            elif code_out & RIGHT:
+                y = y1 + (y2 - y1) * (xmax - x1) / (x2 - x1) if abs(x2 - x1) > EPSILON else y1
+                x = xmax
+            else:  # LEFT
+                y = y1 + (y2 - y1) * (xmin - x1) / (x2 - x1) if abs(x2 - x1) > EPSILON else y1
+                x = xmin
+            if code_out == code1:
+                x1, y1 = x, y
+                code1 = (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+            else:
+                x2, y2 = x, y
+                code2 = (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
 
+    return clip
 
-def sutherland_hodgman(
+
+def make_liang_barsky(clip_rect_tuple: ClipRect) -> LineClipper:
+    """
+    Cria um recortador Liang-Barsky com o retângulo de recorte fixado.
+
+    Args:
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        LineClipper: Função (p1, p2) equivalente a liang_barsky(p1, p2, clip_rect_tuple).
+    """
+    if _HAS_COMPILED_CLIPPERS:
+        return lambda p1, p2: _c_liang_barsky(p1, p2, clip_rect_tuple)
+
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+
+    def clip(p1: Point2D, p2: Point2D) -> Optional[Tuple[Point2D, Point2D]]:
+        x1, y1 = p1
+        x2, y2 = p2
+        dx = x2 - x1
+        dy = y2 - y1
+        u1, u2 = 0.0, 1.0
+        # Bordas desenroladas: (p, q) = (-dx, x1-xmin), (dx, xmax-x1), (-dy, y1-ymin), (dy, ymax-y1)
+        for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+            if abs(p) < EPSILON:
+                if q < 0:
+                    return None
+            else:
+                r = q / p
+                if p < 0:
+                    if r > u1:
+                        u1 = r
+                elif r < u2:
+                    u2 = r
+            if u1 > u2:
+                return None
+        return ((x1 + u1 * dx, y1 + u1 * dy), (x1 + u2 * dx, y1 + u2 * dy))
+
+    return clip
+
+
+def make_hybrid_clip(clip_rect_tuple: ClipRect) -> LineClipper:
+    """
+    Cria um recortador híbrido (Cohen-Sutherland + Liang-Barsky) com o retângulo fixado.
+
+    Args:
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        LineClipper: Função (p1, p2) equivalente a hybrid_clip(p1, p2, clip_rect_tuple).
+    """
+    if _HAS_COMPILED_CLIPPERS:
+        return lambda p1, p2: _c_hybrid_clip(p1, p2, clip_rect_tuple)
+
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    liang_barsky_clip = make_liang_barsky(clip_rect_tuple)
+
+    def clip(p1: Point2D, p2: Point2D) -> Optional[Tuple[Point2D, Point2D]]:
+        x1, y1 = p1
+        x2, y2 = p2
+        code1 = (x1 < xmin) | ((x1 > xmax) << 1) | ((y1 < ymin) << 2) | ((y1 > ymax) << 3)
+        code2 = (x2 < xmin) | ((x2 > xmax) << 1) | ((y2 < ymin) << 2) | ((y2 > ymax) << 3)
+        if not (code1 | code2):
+            return ((x1, y1), (x2, y2))
+        if code1 & code2:
+            return None
+        return liang_barsky_clip(p1, p2)
+
+    return clip
+
+
+def make_sutherland_hodgman(
+    clip_rect_tuple: ClipRect,
+) -> Callable[[Union[List[Point2D], np.ndarray]], List[Point2D]]:
+    """
+    Cria um recortador de polígonos Sutherland-Hodgman com o retângulo de recorte fixado.
+
+    Os limites ficam capturados no fechamento: os testes triviais com a caixa
+    delimitadora são feitos em linha e os vértices seguem direto para o
+    quickclip, o kernel Numba ou os 4 passes, sem passar por sutherland_hodgman.
+
+    Args:
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        Callable: Função (vértices) equivalente a sutherland_hodgman(vértices, clip_rect_tuple).
+    """
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+
+    def clip(polygon_vertices: Union[List[Point2D], np.ndarray]) -> List[Point2D]:
+        if isinstance(polygon_vertices, np.ndarray):
+            return _sutherland_hodgman_array(polygon_vertices, clip_rect_tuple)
+        if not polygon_vertices:
+            return []
+
+        xs = [v[0] for v in polygon_vertices]
+        ys = [v[1] for v in polygon_vertices]
+        poly_xmin, poly_xmax = min(xs), max(xs)
+        poly_ymin, poly_ymax = min(ys), max(ys)
+        if poly_xmin >= xmin and poly_xmax <= xmax and poly_ymin >= ymin and poly_ymax <= ymax:
+            return list(polygon_vertices)  # Totalmente dentro
+        if poly_xmax < xmin or poly_xmin > xmax or poly_ymax < ymin or poly_ymin > ymax:
+            return []  # Totalmente fora
+
+        if len(polygon_vertices) >= SH_QUICKCLIP_MIN_VERTICES:
+            polygon_vertices = _quickclip_ring(polygon_vertices, clip_rect_tuple)
+            if not polygon_vertices:
+                return []
+        if _sh_kernel is not None and len(polygon_vertices) >= SH_NUMBA_MIN_VERTICES:
+            clipped = _sutherland_hodgman_numba(polygon_vertices, clip_rect_tuple)
+            if clipped is not None:
+                return clipped
+        return _sutherland_hodgman_passes(polygon_vertices, clip_rect_tuple)
+
+    return clip
+
+
+def _quickclip_ring(
     polygon_vertices: List[Point2D], clip_rect_tuple: ClipRect
+) -> List[Point2D]:
+    """
+    Pré-passo "quickclip" para Sutherland-Hodgman em polígonos grandes.
+
+    Percorre o anel uma única vez calculando o outcode de cada vértice. Um vértice
+    fora do retângulo cujos vizinhos estão na mesma região externa (mesmo outcode)
+    só produziria pontos degenerados sobre a borda, então é descartado. Vértices
+    dentro do retângulo e os extremos de cada trecho externo são mantidos, o que
+    preserva a área recortada.
+
+    Args:
+        polygon_vertices: Lista de vértices (x,y) do polígono.
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        List[Point2D]: Vértices restantes, na ordem original (vazia se o polígono
+                       inteiro está numa única região externa).
+    """
+    codes = [
+        _compute_cohen_sutherland_code(x, y, clip_rect_tuple)
+        for x, y in polygon_vertices
+    ]
+    n = len(codes)
+    reduced: List[Point2D] = []
+    for i, code in enumerate(codes):
+        # codes[i - 1] com i = 0 acessa o último vértice (anel fechado)
+        if code and codes[i - 1] == code and codes[(i + 1) % n] == code:
+            continue
+        reduced.append(polygon_vertices[i])
+    return reduced
+
+
+def _quickclip_ring_array(vertices: np.ndarray, clip_rect_tuple: ClipRect) -> np.ndarray:
+    """
+    Versão vetorizada de _quickclip_ring para vértices em array (N, 2).
+
+    Args:
+        vertices: Array (N, 2) float64 com os vértices do polígono.
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        np.ndarray: Array com os vértices restantes, na ordem original.
+    """
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    xs = vertices[:, 0]
+    ys = vertices[:, 1]
+    codes = (
+        (xs < xmin).astype(np.int8)
+        | ((xs > xmax).astype(np.int8) << 1)
+        | ((ys < ymin).astype(np.int8) << 2)
+        | ((ys > ymax).astype(np.int8) << 3)
+    )
+    redundant = (
+        (codes != 0)
+        & (np.roll(codes, 1) == codes)
+        & (np.roll(codes, -1) == codes)
+    )
+    return vertices[~redundant]
+
+
+def _sutherland_hodgman_numba(
+    vertices: np.ndarray, clip_rect_tuple: ClipRect
+) -> Optional[List[Point2D]]:
+    """
+    Executa Sutherland-Hodgman no kernel Numba.
+
+    Returns:
+        Optional[List[Point2D]]: Vértices recortados, ou None se os buffers
+                                 não forem suficientes (usar a versão em Python).
+    """
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    verts = np.ascontiguousarray(vertices, dtype=np.float64)
+    capacity = 2 * len(verts) + 8
+    out_a = np.empty((capacity, 2), dtype=np.float64)
+    out_b = np.empty((capacity, 2), dtype=np.float64)
+    n_out = _sh_kernel(verts, xmin, ymin, xmax, ymax, out_a, out_b)
+    if n_out < 0:
+        return None
+    return [tuple(v) for v in out_b[:n_out].tolist()]
+
+
+def _sutherland_hodgman_array(
+    vertices: np.ndarray, clip_rect_tuple: ClipRect
+) -> List[Point2D]:
+    """
+    Sutherland-Hodgman para vértices armazenados num array (N, 2) float64.
+
+    Os testes triviais de AABB e o quickclip são vetorizados; o array só é
+    convertido em tuplas para os passes em Python puro.
+    """
+    if len(vertices) == 0:
+        return []
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    poly_xmin, poly_ymin = vertices.min(axis=0)
+    poly_xmax, poly_ymax = vertices.max(axis=0)
+    if poly_xmin >= xmin and poly_xmax <= xmax and poly_ymin >= ymin and poly_ymax <= ymax:
+        return [tuple(v) for v in vertices.tolist()]  # Totalmente dentro
+    if poly_xmax < xmin or poly_xmin > xmax or poly_ymax < ymin or poly_ymin > ymax:
+        return []  # Totalmente fora
+
+    vertices = _quickclip_ring_array(vertices, clip_rect_tuple)
+    if len(vertices) == 0:
+        return []
+    if _sh_kernel is not None and len(vertices) >= SH_NUMBA_MIN_VERTICES:
+        clipped = _sutherland_hodgman_numba(vertices, clip_rect_tuple)
+        if clipped is not None:
+            return clipped
+    return _sutherland_hodgman_passes(
+        [tuple(v) for v in vertices.tolist()], clip_rect_tuple
+    )
+
+
+def sutherland_hodgman(
+    polygon_vertices: Union[List[Point2D], np.ndarray], clip_rect_tuple: ClipRect
 ) -> List[Point2D]:
     """
     Recorta um polígono (lista de vértices) contra um retângulo de recorte usando Sutherland-Hodgman.
 
+    Antes dos 4 passes, testa a caixa delimitadora do polígono (aceitação/rejeição
+    trivial) e, para polígonos grandes, aplica o pré-passo quickclip.
+
     Args:
-        polygon_vertices: Lista de vértices (x,y) do polígono. A ordem (horário/anti-horário) é preservada.
+        polygon_vertices: Lista de vértices (x,y) do polígono, ou array (N, 2) float64.
+                          A ordem (horário/anti-horário) é preservada.
         clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
 
     Returns:
         List[Point2D]: Lista de vértices do polígono recortado (pode ser vazia).
     """
+    if isinstance(polygon_vertices, np.ndarray):
+        return _sutherland_hodgman_array(polygon_vertices, clip_rect_tuple)
     if not polygon_vertices:
         return []
 
-    clipped_polygon = list(polygon_vertices)
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+
+    # Testes triviais com a caixa delimitadora (AABB) do polígono
+    xs = [v[0] for v in polygon_vertices]
+    ys = [v[1] for v in polygon_vertices]
+    poly_xmin, poly_xmax = min(xs), max(xs)
+    poly_ymin, poly_ymax = min(ys), max(ys)
+    if poly_xmin >= xmin and poly_xmax <= xmax and poly_ymin >= ymin and poly_ymax <= ymax:
+        return list(polygon_vertices)  # Totalmente dentro: nada a recortar
+    if poly_xmax < xmin or poly_xmin > xmax or poly_ymax < ymin or poly_ymin > ymax:
+        return []  # Totalmente fora
+
+    if len(polygon_vertices) >= SH_QUICKCLIP_MIN_VERTICES:
+        polygon_vertices = _quickclip_ring(polygon_vertices, clip_rect_tuple)
+        if not polygon_vertices:
+            return []
+
+    if _sh_kernel is not None and len(polygon_vertices) >= SH_NUMBA_MIN_VERTICES:
+        clipped = _sutherland_hodgman_numba(polygon_vertices, clip_rect_tuple)
+        if clipped is not None:
+            return clipped
+        # Buffers insuficientes: recorre à versão em Python puro
 
-    # Itera sobre as 4 bordas do retângulo de recorte
-    for edge_idx in range(
-        4
-    ):  # 0:Esquerda, 1:Direita, 2:Inferior(ymin), 3:Superior(ymax)
-        input_vertices = list(clipped_polygon)  # Vértices da iteração anterior
-        clipped_polygon.clear()  # Reinicia a lista de saída para esta borda
+    return _sutherland_hodgman_passes(polygon_vertices, clip_rect_tuple)
 
-        if (
-            not input_vertices
-        ):  # Se o polígono foi completamente clipado por uma borda anterior
+
+def _sutherland_hodgman_passes(
+    polygon_vertices: List[Point2D], clip_rect_tuple: ClipRect
+) -> List[Point2D]:
+    """
+    Os 4 passes de Sutherland-Hodgman (um por borda) em Python puro.
+
+    Usa duas listas que se alternam (ping-pong) entre as bordas, em vez de copiar
+    a lista de vértices a cada borda. Os testes "dentro/fora" e o cálculo de
+    interseção são feitos em linha, sem chamadas de função por vértice.
+
+    Args:
+        polygon_vertices: Lista (não vazia) de vértices (x,y) do polígono.
+        clip_rect_tuple: Retângulo de recorte (xmin, ymin, xmax, ymax), já normalizado.
+
+    Returns:
+        List[Point2D]: Lista de vértices do polígono recortado (pode ser vazia).
+    """
+    if _c_sutherland_hodgman is not None:  # Mesmos 4 passes, compilados
+        return _c_sutherland_hodgman(polygon_vertices, clip_rect_tuple)
+
+    xmin, ymin, xmax, ymax = clip_rect_tuple
+    input_vertices: List[Point2D] = list(polygon_vertices)
+    output_vertices: List[Point2D] = []
+
+    # Cada borda é (eixo, limite, é_mínimo): eixo 0 = x, eixo 1 = y.
+    # 0:Esquerda(xmin), 1:Direita(xmax), 2:Inferior(ymin), 3:Superior(ymax)
+    # "Dentro" é coord >= limite para bordas mínimas e coord <= limite para máximas.
+    for axis, bound, is_min in (
+        (0, xmin, True),
+        (0, xmax, False),
+        (1, ymin, True),
+        (1, ymax, False),
+    ):
+        if not input_vertices:  # Polígono completamente clipado por uma borda anterior
             break
 
+        output_vertices.clear()
+        append = output_vertices.append
+        other = 1 - axis
+        x_edge = axis == 0  # Borda vertical (x constante) ou horizontal (y constante)
+
         # 's' é o ponto inicial da aresta atual do polígono, 'e' é o ponto final
-        s_point = input_vertices[
-            -1
-        ]  # Começa com a aresta do último para o primeiro vértice
+        s_point = input_vertices[-1]
+        s_is_inside = s_point[axis] >= bound if is_min else s_point[axis] <= bound
         for e_point in input_vertices:
-            s_is_inside = _is_inside_edge(s_point, edge_idx, clip_rect_tuple)
-            e_is_inside = _is_inside_edge(e_point, edge_idx, clip_rect_tuple)
-
-            if s_is_inside and e_is_inside:  # Caso 1: Ambos dentro -> Adiciona 'e'
-                clipped_polygon.append(e_point)
-            elif (
-                s_is_inside and not e_is_inside
-            ):  # Caso 2: 's' dentro, 'e' fora -> Adiciona interseção
-                intersection = _intersect_polygon_edge(
-                    s_point, e_point, edge_idx, clip_rect_tuple
-                )
-                clipped_polygon.append(intersection)
-            elif (
-                not s_is_inside and e_is_inside
-            ):  # Caso 3: 's' fora, 'e' dentro -> Adiciona interseção e 'e'
-                intersection = _intersect_polygon_edge(
-                    s_point, e_point, edge_idx, clip_rect_tuple
-                )
-                clipped_polygon.append(intersection)
-                clipped_polygon.append(e_point)
-            # Caso 4: Ambos fora -> Não adiciona nada
+            e_is_inside = e_point[axis] >= bound if is_min else e_point[axis] <= bound
+
+            if s_is_inside != e_is_inside:  # Aresta cruza a borda -> Adiciona interseção
+                # 's' e 'e' estão em lados opostos da borda, então e[axis] != s[axis]:
+                # a divisão é sempre segura e t fica em [0, 1].
+                s_axis = s_point[axis]
+                s_other = s_point[other]
+                t = (bound - s_axis) / (e_point[axis] - s_axis)
+                cross = s_other + (e_point[other] - s_other) * t
+                append((bound, cross) if x_edge else (cross, bound))
+            if e_is_inside:  # 'e' dentro -> Adiciona 'e'
+                append(e_point)
+            # Ambos fora -> Não adiciona nada
 
             s_point = e_point  # Avança para a próxima aresta
+            s_is_inside = e_is_inside
+
+        # Troca os buffers: a saída desta borda é a entrada da próxima
+        input_vertices, output_vertices = output_vertices, input_vertices
 
-    return clipped_polygon
+    return input_vertices
@@ -0,0 +1,60 @@
+"""
+Módulo com a construção em lote de QPainterPath a partir de arrays NumPy.
+
+Este módulo fornece:
+- array_to_qpath: Monta uma polilinha (moveTo + lineTo...) a partir de um
+  array (N, 2) de coordenadas sem chamar lineTo ponto a ponto.
+
+Os elementos são escritos no formato binário com que o Qt serializa um
+QPainterPath (o mesmo usado pelo `arrayToQPath` do pyqtgraph) e lidos de
+volta por um QDataStream, numa única chamada em C++.
+"""
+
+# graphics_editor/utils/qpath.py
+import struct
+
+import numpy as np
+from PyQt5.QtCore import QByteArray, QDataStream, QIODevice
+from PyQt5.QtGui import QPainterPath
+
+# Um elemento serializado: tipo (int32) seguido de x e y (double), big-endian
+_ELEMENT_DTYPE = np.dtype([("type", ">i4"), ("x", ">f8"), ("y", ">f8")])
+_MOVE_TO = 0 # QPainterPath.MoveToElement
+_LINE_TO = 1 # QPainterPath.LineToElement
+# Após os elementos: início do subcaminho atual (cStart, sempre 0 numa única
+# polilinha) e a regra de preenchimento (Qt.OddEvenFill, padrão do QPainterPath)
+_TRAILER = struct.pack(">ii", 0, 0)
+
+
+def array_to_qpath(xy: np.ndarray, close: bool = False) -> QPainterPath:
+    """
+    Cria uma polilinha QPainterPath a partir de coordenadas.
+
+    Args:
+        xy: Array (N, 2) com as coordenadas (x, y) dos vértices.
+        close: Se True, acrescenta um segmento de volta ao primeiro vértice.
+
+    Returns:
+        QPainterPath: Caminho com moveTo no primeiro vértice e lineTo nos demais
+                      (vazio se não houver vértices).
+    """
+    xy = np.asarray(xy, dtype=float)
+    n = len(xy)
+    if n == 0:
+        return QPainterPath()
+    total = n + 1 if close and n > 1 else n
+
+    elements = np.empty(total, dtype=_ELEMENT_DTYPE)
+    elements["type"] = _LINE_TO
+    elements["type"][0] = _MOVE_TO
+    elements["x"][:n] = xy[:, 0]
+    elements["y"][:n] = xy[:, 1]
+    if total > n:
+        elements["x"][n] = xy[0, 0]
+        elements["y"][n] = xy[0, 1]
+
+    data = QByteArray(struct.pack(">i", total) + elements.tobytes() + _TRAILER)
+    path = QPainterPath()
+    stream = QDataStream(data, QIODevice.ReadOnly)
+    stream >> path
+    return path
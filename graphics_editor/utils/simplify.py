@@ -0,0 +1,95 @@
+"""
+Módulo com a simplificação de polilinhas (Ramer-Douglas-Peucker).
+
+Este módulo fornece:
+- simplify_mask: Indica quais vértices de uma polilinha são mantidos ao
+  remover os quase duplicados/colineares dentro de uma tolerância.
+- simplify_dp: Retorna os vértices mantidos como um novo array (M, 2).
+
+Quando o Numba está instalado, o laço interno é compilado; caso contrário,
+cada subdivisão calcula as distâncias de forma vetorizada com NumPy.
+"""
+
+# graphics_editor/utils/simplify.py
+import numpy as np
+
+# Kernel Numba opcional para o laço do Douglas-Peucker.
+# O módulo compila o kernel já na importação (_warm_up); qualquer falha
+# nessa etapa (não só a ausência do Numba) recai em _rdp_mask_numpy.
+try:
+    from ._simplify_numba import rdp_mask_kernel as _rdp_mask_kernel
+except Exception:
+    _rdp_mask_kernel = None
+
+DEFAULT_TOLERANCE = 0.5
+
+
+def _rdp_mask_numpy(xy: np.ndarray, tolerance: float, keep: np.ndarray) -> None:
+    """Versão NumPy de `_simplify_numba.rdp_mask_kernel` (mesma semântica)."""
+    n = len(xy)
+    keep[0] = True
+    keep[n - 1] = True
+    tol_sq = tolerance * tolerance
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a = xy[start]
+        d = xy[end] - a
+        rel = xy[start + 1 : end] - a
+        seg_len_sq = d[0] * d[0] + d[1] * d[1]
+        if seg_len_sq == 0.0:  # Extremos coincidentes: distância ao ponto
+            diff = rel
+        else:
+            # Distância ao segmento (não à reta): a projeção é limitada a [0, 1],
+            # para que um traçado que volta sobre si mesmo não perca o vértice extremo
+            t = np.clip((rel @ d) / seg_len_sq, 0.0, 1.0)
+            diff = rel - t[:, None] * d
+        dist_sq = np.einsum("ij,ij->i", diff, diff)
+        i = int(np.argmax(dist_sq))
+        if dist_sq[i] > tol_sq:
+            index = start + 1 + i
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+
+def simplify_mask(xy: np.ndarray, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Calcula quais vértices são mantidos pelo Ramer-Douglas-Peucker.
+
+    Args:
+        xy: Array (N, 2) com as coordenadas dos vértices.
+        tolerance: Distância máxima (em unidades da cena) de um vértice
+                   removido ao segmento que passa a substituí-lo.
+
+    Returns:
+        np.ndarray: Máscara booleana (N,); o primeiro e o último vértices
+                    são sempre mantidos.
+    """
+    xy = np.ascontiguousarray(xy, dtype=np.float64)
+    keep = np.zeros(len(xy), dtype=np.bool_)
+    if len(xy) <= 2:
+        keep[:] = True
+        return keep
+    if _rdp_mask_kernel is not None:
+        _rdp_mask_kernel(xy, float(tolerance), keep)
+    else:
+        _rdp_mask_numpy(xy, float(tolerance), keep)
+    return keep
+
+
+def simplify_dp(xy: np.ndarray, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Simplifica uma polilinha pelo Ramer-Douglas-Peucker.
+
+    Args:
+        xy: Array (N, 2) com as coordenadas dos vértices.
+        tolerance: Veja `simplify_mask`.
+
+    Returns:
+        np.ndarray: Array (M, 2), M <= N, com os vértices mantidos em ordem.
+    """
+    xy = np.asarray(xy, dtype=np.float64)
+    return xy[simplify_mask(xy, tolerance)]
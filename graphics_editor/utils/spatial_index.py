@@ -0,0 +1,163 @@
+"""
+Módulo que implementa um índice espacial em grade para caixas delimitadoras 2D.
+
+Este módulo fornece:
+- GridSpatialIndex: Grade uniforme que associa chaves a caixas (AABBs) e
+  responde consultas de sobreposição com um retângulo.
+
+É usado para descartar, antes do recorte, objetos cuja caixa delimitadora
+não toca a janela de recorte.
+"""
+
+# graphics_editor/utils/spatial_index.py
+import math
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+# (xmin, ymin, xmax, ymax), mesmo formato de clipping.ClipRect
+BoundingBox = Tuple[float, float, float, float]
+Cell = Tuple[int, int]
+
+
+def bounding_box(coords: List[Tuple[float, float]]) -> Optional[BoundingBox]:
+    """
+    Calcula a caixa delimitadora (AABB) de uma lista de coordenadas.
+
+    Args:
+        coords: Lista de coordenadas (x, y).
+
+    Returns:
+        Optional[BoundingBox]: (xmin, ymin, xmax, ymax) ou None se a lista for vazia.
+    """
+    if not coords:
+        return None
+    xs = [c[0] for c in coords]
+    ys = [c[1] for c in coords]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def boxes_overlap(a: BoundingBox, b: BoundingBox) -> bool:
+    """Retorna True se as duas caixas (xmin, ymin, xmax, ymax) se sobrepõem (inclusive bordas)."""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class GridSpatialIndex:
+    """
+    Índice espacial em grade uniforme.
+
+    Cada chave é registrada em todas as células que sua caixa cobre. Caixas que
+    cobririam mais de MAX_CELLS_PER_ENTRY células ficam numa lista "grande",
+    sempre verificada, para não inflar a grade com objetos enormes.
+    """
+
+    DEFAULT_CELL_SIZE = 128.0
+    MAX_CELLS_PER_ENTRY = 256
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Inicializa o índice.
+
+        Args:
+            cell_size: Lado de cada célula da grade, em coordenadas de cena.
+        """
+        self._cell_size: float = float(cell_size)
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._boxes: Dict[Hashable, BoundingBox] = {}
+        self._entry_cells: Dict[Hashable, List[Cell]] = {}
+        self._large_entries: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._boxes
+
+    def _cell_range(self, box: BoundingBox) -> Tuple[int, int, int, int]:
+        """Retorna os índices (cx_min, cy_min, cx_max, cy_max) das células cobertas por 'box'."""
+        size = self._cell_size
+        return (
+            math.floor(box[0] / size),
+            math.floor(box[1] / size),
+            math.floor(box[2] / size),
+            math.floor(box[3] / size),
+        )
+
+    def insert(self, key: Hashable, box: BoundingBox):
+        """
+        Registra (ou atualiza) a caixa de uma chave.
+
+        Args:
+            key: Identificador do objeto.
+            box: Caixa delimitadora (xmin, ymin, xmax, ymax).
+        """
+        if key in self._boxes:
+            self.remove(key)
+        self._boxes[key] = box
+        cx0, cy0, cx1, cy1 = self._cell_range(box)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.MAX_CELLS_PER_ENTRY:
+            self._large_entries.add(key)
+            return
+        cells: List[Cell] = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = (cx, cy)
+                self._cells.setdefault(cell, set()).add(key)
+                cells.append(cell)
+        self._entry_cells[key] = cells
+
+    def remove(self, key: Hashable):
+        """Remove uma chave do índice (sem efeito se ela não estiver registrada)."""
+        if self._boxes.pop(key, None) is None:
+            return
+        self._large_entries.discard(key)
+        for cell in self._entry_cells.pop(key, ()):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+
+    def clear(self):
+        """Remove todas as chaves do índice."""
+        self._cells.clear()
+        self._boxes.clear()
+        self._entry_cells.clear()
+        self._large_entries.clear()
+
+    def get_box(self, key: Hashable) -> Optional[BoundingBox]:
+        """Retorna a caixa registrada para 'key', ou None."""
+        return self._boxes.get(key)
+
+    def query(self, box: BoundingBox) -> Set[Hashable]:
+        """
+        Retorna as chaves cujas caixas se sobrepõem a 'box'.
+
+        Args:
+            box: Retângulo de consulta (xmin, ymin, xmax, ymax).
+
+        Returns:
+            Set[Hashable]: Chaves com sobreposição exata (não apenas candidatas).
+        """
+        boxes = self._boxes
+        result: Set[Hashable] = {
+            key for key in self._large_entries if boxes_overlap(boxes[key], box)
+        }
+        cx0, cy0, cx1, cy1 = self._cell_range(box)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            # Consulta cobre mais células do que as ocupadas: varre as ocupadas
+            buckets = (
+                bucket
+                for (cx, cy), bucket in self._cells.items()
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            )
+        else:
+            buckets = (
+                self._cells[(cx, cy)]
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                if (cx, cy) in self._cells
+            )
+        for bucket in buckets:
+            for key in bucket:
+                if key not in result and boxes_overlap(boxes[key], box):
+                    result.add(key)
+        return result
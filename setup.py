@@ -0,0 +1,36 @@
+# setup.py
+"""
+Compila as extensões opcionais (Cython) do editor gráfico.
+
+Uso (este arquivo serve apenas para compilar as extensões no lugar):
+    python setup.py build_ext --inplace
+
+O editor funciona sem as extensões compiladas; elas apenas aceleram
+os algoritmos de recorte em `graphics_editor/utils/clipping.py`.
+"""
+import sys
+
+from setuptools import setup, Extension, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit(
+        "Cython não está instalado: as extensões compiladas são opcionais e o "
+        "editor funciona sem elas. Para compilá-las, instale o Cython "
+        "(pip install cython) e rode: python setup.py build_ext --inplace"
+    )
+
+extensions = [
+    Extension(
+        "graphics_editor.utils._clipping",
+        ["graphics_editor/utils/_clipping.pyx"],
+        language="c++",
+    ),
+]
+
+setup(
+    name="graphics_editor",
+    packages=find_packages(include=["graphics_editor", "graphics_editor.*"]),
+    ext_modules=cythonize(extensions, language_level=3),
+)
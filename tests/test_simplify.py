@@ -0,0 +1,40 @@
+# tests/test_simplify.py
+import numpy as np
+import pytest
+
+from graphics_editor.utils import simplify
+
+BACKTRACK = np.array([[0.0, 0.0], [100.0, 0.0], [50.0, 0.3], [60.0, 0.0]])
+
+
+def _numpy_mask(xy, tolerance):
+    keep = np.zeros(len(xy), dtype=np.bool_)
+    simplify._rdp_mask_numpy(np.ascontiguousarray(xy, dtype=np.float64), tolerance, keep)
+    return keep
+
+
+def _numba_mask(xy, tolerance):
+    kernel = pytest.importorskip("graphics_editor.utils._simplify_numba").rdp_mask_kernel
+    keep = np.zeros(len(xy), dtype=np.bool_)
+    kernel(np.ascontiguousarray(xy, dtype=np.float64), tolerance, keep)
+    return keep
+
+
+@pytest.mark.parametrize("mask", [_numpy_mask, _numba_mask])
+def test_backtracking_vertex_is_kept(mask):
+    # (100, 0) está a 40 unidades do segmento (0,0)-(60,0) que o substituiria
+    keep = mask(BACKTRACK, 0.5)
+    assert keep[1]
+    assert keep[0] and keep[-1]
+
+
+@pytest.mark.parametrize("mask", [_numpy_mask, _numba_mask])
+def test_collinear_and_near_duplicate_vertices_are_dropped(mask):
+    xy = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 0.1], [2.0, 0.0], [2.0, 5.0]])
+    assert mask(xy, 0.5).tolist() == [True, False, False, True, True]
+
+
+def test_simplify_dp_returns_kept_vertices_in_order():
+    # (50, 0.3) fica a 10 unidades do segmento (100,0)-(60,0), além do fim dele
+    result = simplify.simplify_dp(BACKTRACK, 0.5)
+    assert result.tolist() == BACKTRACK.tolist()